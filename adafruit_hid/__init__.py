@@ -41,50 +41,160 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_HID.git"
 
 
+# Index of the devices found in the last tuple of devices searched, usually
+# usb_hid.devices, as (devices, {(usage_page, usage): device}).
+_device_index = (None, None)
+
+# Blinka cannot tell when USB is ready, so it waits once, the first time a device is found.
+_blinka_waited = False  # pylint: disable=invalid-name
+
+# Bounds of the exponential backoff while waiting for USB to become ready, in seconds.
+_FIRST_POLL_INTERVAL = 0.001
+_MAX_POLL_INTERVAL = 0.1
+
+# Millisecond ticks wrap around at 2**29, like supervisor.ticks_ms().
+_TICKS_PERIOD = 1 << 29
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALFPERIOD = _TICKS_PERIOD // 2
+
+
+def _ticks_ms() -> int:
+    """Return a millisecond counter, wrapping around at 2**29.
+
+    Unlike the float of ``time.monotonic()``, which loses its millisecond resolution
+    after about an hour of uptime on CircuitPython, the ticks keep their resolution,
+    and they are small integers, that do not allocate memory.
+    """
+    if supervisor is not None:
+        return supervisor.ticks_ms()
+    return (time.monotonic_ns() // 1000000) & _TICKS_MAX
+
+
+def _ticks_add(ticks: int, delta: int) -> int:
+    """Return ``ticks`` plus ``delta`` milliseconds, wrapping around like the ticks."""
+    return (ticks + delta) & _TICKS_MAX
+
+
+def _ticks_diff(ticks1: int, ticks2: int) -> int:
+    """Return ``ticks1 - ticks2`` in milliseconds, correct across the wrap around
+    when the difference is less than 2**28 milliseconds, about three days."""
+    return ((ticks1 - ticks2 + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
+
+
+def _lookup(devices: Sequence[object], usage_page: int, usage: int) -> object:
+    """Return the first device with the given usage_page and usage, or None.
+
+    Tuples, such as ``usb_hid.devices``, cannot change, so they are indexed once
+    and the following lookups are a dict access. Other sequences are searched each time.
+    """
+    global _device_index  # pylint: disable=global-statement
+    if isinstance(devices, tuple):
+        if _device_index[0] is not devices:
+            index = {}
+            for dev in devices:
+                if hasattr(dev, "send_report"):
+                    key = (dev.usage_page, dev.usage)
+                    if key not in index:
+                        index[key] = dev
+            _device_index = (devices, index)
+        return _device_index[1].get((usage_page, usage))
+    for dev in devices:
+        if (
+            dev.usage_page == usage_page
+            and dev.usage == usage
+            and hasattr(dev, "send_report")
+        ):
+            return dev
+    return None
+
+
+def usb_connected() -> bool:
+    """Return ``True`` if USB is connected, so that HID reports can be sent, without waiting.
+    Always ``True`` on Blinka, which cannot tell."""
+    return supervisor is None or supervisor.runtime.usb_connected
+
+
+def _wait_for_usb(timeout: float = None) -> None:
+    """Wait for USB to be connected, polling with an exponential backoff, from
+    1 millisecond to 0.1 seconds, so that an already connected USB costs nothing.
+
+    :raises OSError: if USB is not connected within ``timeout`` seconds.
+    """
+    global _blinka_waited  # pylint: disable=global-statement
+    if supervisor is None:
+        # Blinka doesn't have supervisor (see issue Adafruit_Blinka#711), so wait
+        # one second for USB to become ready, only once per process.
+        if not _blinka_waited:
+            time.sleep(1.0)
+            _blinka_waited = True
+        return
+    interval = _FIRST_POLL_INTERVAL
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not supervisor.runtime.usb_connected:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise OSError("Failed to initialize HID device. Is USB connected?")
+            interval = min(interval, remaining)
+        time.sleep(interval)
+        interval = min(interval * 2, _MAX_POLL_INTERVAL)
+
+
 def find_device(
     devices: Sequence[object],
     *,
     usage_page: int,
     usage: int,
     timeout: int = None,
+    wait: bool = True,
 ) -> object:
     """Search through the provided sequence of devices to find the one with the matching
     usage_page and usage.
 
     :param timeout: Time in seconds to wait for USB to become ready before timing out.
     Defaults to None to wait indefinitely.
-    Ignored if device is not a `usb_hid.Device`; it might be BLE, for instance."""
+    Ignored if device is not a `usb_hid.Device`; it might be BLE, for instance.
+    :param wait: ``False`` to return the device at once, without waiting for USB,
+    see `usb_connected()` and `adafruit_hid.lazy_device.LazyDevice`.
+
+    A tuple of devices, such as ``usb_hid.devices``, is indexed on its first search, so
+    creating several HID objects from it does not scan it each time. USB readiness is
+    polled every millisecond at first, backing off to every 0.1 seconds."""
 
     if hasattr(devices, "send_report"):
         devices = [devices]  # type: ignore
-    device = None
-    for dev in devices:
-        if (
-            dev.usage_page == usage_page
-            and dev.usage == usage
-            and hasattr(dev, "send_report")
-        ):
-            device = dev
-            break
+    device = _lookup(devices, usage_page, usage)
     if device is None:
         raise ValueError("Could not find matching HID device.")
 
     # Wait for USB to be connected only if this is a usb_hid.Device.
-    if Device and isinstance(device, Device):
-        if supervisor is None:
-            # Blinka doesn't have supervisor (see issue Adafruit_Blinka#711), so wait
-            # one second for USB to become ready
-            time.sleep(1.0)
-        elif timeout is None:
-            # default behavior: wait indefinitely for USB to become ready
-            while not supervisor.runtime.usb_connected:
-                time.sleep(1.0)
-        else:
-            # wait up to timeout seconds for USB to become ready
-            for _ in range(timeout):
-                if supervisor.runtime.usb_connected:
-                    return device
-                time.sleep(1.0)
-            raise OSError("Failed to initialize HID device. Is USB connected?")
+    if wait and Device and isinstance(device, Device):
+        _wait_for_usb(timeout)
 
     return device
+
+
+def _deduplicated(
+    device: object, deduplicate: bool, relative_start: int = None
+) -> object:
+    """Return the device wrapped in a `adafruit_hid.report_filter.ReportFilter` if
+    ``deduplicate`` is ``True``, for the HID objects given ``deduplicate=True``,
+    or else the device itself."""
+    if not deduplicate:
+        return device
+    # Only imported when used, to keep importing the HID modules light.
+    from .report_filter import ReportFilter  # pylint: disable=import-outside-toplevel
+
+    return ReportFilter(device, relative_start=relative_start)
+
+
+def _suppressed_reports_property(device_attribute: str) -> property:
+    """Return the ``suppressed_reports`` property of a HID object whose device,
+    possibly returned by `_deduplicated()`, is in the given attribute."""
+
+    def suppressed_reports(self) -> int:
+        """Number of reports not sent because they were identical to the last one,
+        when created with ``deduplicate=True``."""
+        return getattr(getattr(self, device_attribute), "suppressed_reports", 0)
+
+    return property(suppressed_reports)
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.absolute_mouse.AbsoluteMouse`
+====================================================
+"""
+
+from . import find_device
+from .mouse import Mouse
+
+try:
+    from typing import Optional, Sequence
+    import usb_hid
+except ImportError:
+    pass
+
+
+# The button part of the descriptor is the same as in the 16-bit Mouse descriptor.
+# pylint: disable=duplicate-code
+_REPORT_DESCRIPTOR = (
+    b"\x05\x01"  # Usage Page (Generic Desktop)
+    b"\x09\x01"  # Usage (Pointer)
+    b"\xa1\x01"  # Collection (Application)
+    b"\x85\x04"  #   Report ID (set by report_descriptor())
+    b"\x09\x01"  #   Usage (Pointer)
+    b"\xa1\x00"  #   Collection (Physical)
+    b"\x05\x09"  #     Usage Page (Button)
+    b"\x19\x01"  #     Usage Minimum (Button 1)
+    b"\x29\x05"  #     Usage Maximum (Button 5)
+    b"\x15\x00"  #     Logical Minimum (0)
+    b"\x25\x01"  #     Logical Maximum (1)
+    b"\x95\x05"  #     Report Count (5)
+    b"\x75\x01"  #     Report Size (1)
+    b"\x81\x02"  #     Input (Data, Variable, Absolute)
+    b"\x95\x01"  #     Report Count (1)
+    b"\x75\x03"  #     Report Size (3)
+    b"\x81\x01"  #     Input (Constant)
+    b"\x05\x01"  #     Usage Page (Generic Desktop)
+    b"\x09\x30"  #     Usage (X)
+    b"\x09\x31"  #     Usage (Y)
+    b"\x15\x00"  #     Logical Minimum (0)
+    b"\x26\xff\x7f"  #     Logical Maximum (32767)
+    b"\x75\x10"  #     Report Size (16)
+    b"\x95\x02"  #     Report Count (2)
+    b"\x81\x02"  #     Input (Data, Variable, Absolute)
+    b"\x09\x38"  #     Usage (Wheel)
+    b"\x15\x81"  #     Logical Minimum (-127)
+    b"\x25\x7f"  #     Logical Maximum (127)
+    b"\x75\x08"  #     Report Size (8)
+    b"\x95\x01"  #     Report Count (1)
+    b"\x81\x06"  #     Input (Data, Variable, Relative)
+    b"\xc0"  #   End Collection
+    b"\xc0"  # End Collection
+)
+
+
+def report_descriptor(report_id: int = 4) -> bytes:
+    """Return the HID report descriptor of an absolute pointer: 5 buttons, 15-bit absolute
+    x and y, and a relative wheel.
+
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+    """
+    descriptor = bytearray(_REPORT_DESCRIPTOR)
+    descriptor[7] = report_id
+    return bytes(descriptor)
+
+
+def create_device(report_id: int = 4) -> usb_hid.Device:
+    """Return a ``usb_hid.Device`` for an absolute pointer, to enable in ``boot.py``.
+
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+
+    Example::
+
+        # boot.py
+        import usb_hid
+        from adafruit_hid.absolute_mouse import create_device
+
+        usb_hid.enable((usb_hid.Device.KEYBOARD, create_device()))
+    """
+    import usb_hid  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    return usb_hid.Device(
+        report_descriptor=report_descriptor(report_id),
+        usage_page=0x01,
+        usage=0x01,
+        report_ids=(report_id,),
+        in_report_lengths=(6,),
+        out_report_lengths=(0,),
+    )
+
+
+class AbsoluteMouse:
+    """Send USB HID absolute pointer reports, moving the pointer directly to a position.
+
+    Positions go from 0 to 32767 on each axis, covering the whole screen whatever its
+    resolution, and are not affected by the pointer acceleration of the host.
+    The device must be enabled in ``boot.py``, see `create_device()`.
+    """
+
+    LEFT_BUTTON = Mouse.LEFT_BUTTON
+    """Left mouse button."""
+    RIGHT_BUTTON = Mouse.RIGHT_BUTTON
+    """Right mouse button."""
+    MIDDLE_BUTTON = Mouse.MIDDLE_BUTTON
+    """Middle mouse button."""
+    BACK_BUTTON = Mouse.BACK_BUTTON
+    """Back mouse button."""
+    FORWARD_BUTTON = Mouse.FORWARD_BUTTON
+    """Forward mouse button."""
+
+    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+        """Create an AbsoluteMouse object that will send absolute pointer HID reports.
+
+        :param timeout: Time in seconds to wait for USB to become ready before timing out.
+          Defaults to None to wait indefinitely.
+
+        Devices can be a sequence of devices that includes an absolute pointer device or
+        an absolute pointer device itself. A device is any object that implements
+        ``send_report()``, ``usage_page`` and ``usage``.
+        """
+        self._pointer_device = find_device(
+            devices, usage_page=0x1, usage=0x01, timeout=timeout
+        )
+
+        # Reuse this bytearray to send pointer reports.
+        # report[0] buttons pressed
+        # report[1:3] x position, little endian
+        # report[3:5] y position, little endian
+        # report[5] wheel movement
+        self.report = bytearray(6)
+
+    def press(self, buttons: int) -> None:
+        """Press the given mouse buttons, at the current position.
+
+        :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
+            ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+        """
+        self.report[0] |= buttons
+        self._send(0)
+
+    def release(self, buttons: int) -> None:
+        """Release the given mouse buttons.
+
+        :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
+            ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+        """
+        self.report[0] &= ~buttons
+        self._send(0)
+
+    def release_all(self) -> None:
+        """Release all the mouse buttons."""
+        self.report[0] = 0
+        self._send(0)
+
+    def click(self, buttons: int) -> None:
+        """Press and release the given mouse buttons.
+
+        :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
+            ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+        """
+        self.press(buttons)
+        self.release(buttons)
+
+    def move(
+        self, x: Optional[int] = None, y: Optional[int] = None, wheel: int = 0
+    ) -> None:
+        """Move the pointer to the given position, in a single report,
+        and turn the wheel as directed.
+
+        :param x: Position on the x axis, from 0 (left) to 32767 (right).
+          ``None`` keeps the current position.
+        :param y: Position on the y axis, from 0 (top) to 32767 (bottom).
+          ``None`` keeps the current position.
+        :param wheel: Rotate the wheel this amount, relative to its current position.
+
+        Examples::
+
+            # Move to the center of the screen.
+            m.move(16384, 16384)
+
+            # Move to the pixel (100, 200) of a 3840x2160 screen.
+            m.move(100 * 32767 // 3839, 200 * 32767 // 2159)
+        """
+        if x is not None:
+            x = min(32767, max(0, x))
+            self.report[1] = x & 0xFF
+            self.report[2] = x >> 8
+        if y is not None:
+            y = min(32767, max(0, y))
+            self.report[3] = y & 0xFF
+            self.report[4] = y >> 8
+        # Send multiple reports if necessary to scroll the requested amount.
+        while True:
+            partial_wheel = min(127, max(-127, wheel))
+            self._send(partial_wheel)
+            wheel -= partial_wheel
+            if not wheel:
+                break
+
+    def _send(self, wheel: int) -> None:
+        """Send a report at the current position, with the given wheel movement."""
+        self.report[5] = wheel & 0xFF
+        self._pointer_device.send_report(self.report)
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.axis_conditioner.AxisConditioner`
+====================================================
+"""
+
+from array import array
+
+try:
+    from typing import Sequence
+except ImportError:
+    pass
+
+
+class AxisConditioner:
+    """Turn raw analog readings, such as ``AnalogIn.value``, into stable joystick values
+    from -127 to 127, so that ADC noise does not produce a flood of HID reports.
+
+    Each reading goes through, in order:
+
+    * exponential smoothing, with a weight of ``1 / 2**smoothing`` for the new reading;
+    * calibration, mapping the per-axis minimum, center and maximum to -127, 0 and 127;
+    * a deadzone around the center, in which the value is 0. Leaving the deadzone
+      takes an extra ``hysteresis``, so that a stick resting on its edge stays at 0;
+    * a minimum change of ``threshold`` from the last value output. The center and
+      both ends are always output, so that they can be reached exactly.
+
+    All the axes are processed together by `update()`, with integer math only.
+
+    :param int axes: number of axes.
+    :param int in_min: smallest raw reading, 0 for ``AnalogIn``.
+    :param int in_max: largest raw reading, 65535 for ``AnalogIn``.
+    :param int smoothing: smoothing shift, from 0 (none) to 8 (heavy).
+    :param int deadzone: half-width of the deadzone, in output units.
+    :param int hysteresis: extra distance to leave the deadzone, in output units.
+    :param int threshold: minimum change of the output, in output units.
+
+    Example::
+
+        conditioner = AxisConditioner(2, in_max=1023, deadzone=6, threshold=2)
+        gp = Gamepad(usb_hid.devices, axes=2, conditioner=conditioner)
+        while True:
+            gp.update_axes((ss.analog_read(2), ss.analog_read(3)))
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        axes: int,
+        *,
+        in_min: int = 0,
+        in_max: int = 65535,
+        smoothing: int = 2,
+        deadzone: int = 0,
+        hysteresis: int = 0,
+        threshold: int = 1,
+    ) -> None:
+        if not 0 <= smoothing <= 8:
+            raise ValueError("smoothing must be in range 0 to 8")
+        if not 0 <= deadzone < 127:
+            raise ValueError("deadzone must be in range 0 to 126")
+        self.axes = axes
+        """Number of axes."""
+        self.smoothing = smoothing
+        self.deadzone = deadzone
+        self.hysteresis = hysteresis
+        self.threshold = threshold
+        self._minimum = array("l", (in_min,) * axes)
+        self._center = array("l", ((in_min + in_max) // 2,) * axes)
+        self._maximum = array("l", (in_max,) * axes)
+        # Smoothed readings, with 8 fractional bits.
+        self._smoothed = array("l", (((in_min + in_max) // 2) << 8,) * axes)
+        self._primed = False
+        self.values = array("b", bytes(axes))
+        """The last conditioned values, from -127 to 127, one per axis."""
+
+    def calibrate(self, axis: int, minimum: int, center: int, maximum: int) -> None:
+        """Set the raw readings of an axis at its minimum, center and maximum positions.
+
+        :param int axis: axis number, from 0.
+        """
+        if not minimum < center < maximum:
+            raise ValueError("Calibration must have minimum < center < maximum")
+        self._minimum[axis] = minimum
+        self._center[axis] = center
+        self._maximum[axis] = maximum
+
+    def calibrate_center(self, readings: Sequence[int]) -> None:
+        """Use the given raw readings, taken with the sticks at rest, as the centers
+        of the axes."""
+        axis = 0
+        while axis < self.axes:
+            center = readings[axis]
+            if self._minimum[axis] < center < self._maximum[axis]:
+                self._center[axis] = center
+            axis += 1
+
+    def reset(self) -> None:
+        """Forget the smoothing history, and set all the values to 0."""
+        self._primed = False
+        axis = 0
+        while axis < self.axes:
+            self.values[axis] = 0
+            axis += 1
+
+    def update(self, readings: Sequence[int]) -> bool:
+        """Condition one raw reading per axis, and update `values`.
+
+        :returns: ``True`` if any of the `values` changed.
+        """
+        # pylint: disable=too-many-locals
+        smoothed = self._smoothed
+        values = self.values
+        shift = self.smoothing
+        # Rounding the smoothing steps and the result lets the smoothed value settle
+        # on the reading itself, so that the ends of the axes are reached.
+        bias = ((1 << shift) - 1) >> 1
+        deadzone = self.deadzone
+        threshold = self.threshold
+        changed = False
+        axis = 0
+        while axis < self.axes:
+            # Exponential smoothing, in fixed point.
+            raw = readings[axis] << 8
+            if self._primed:
+                raw = smoothed[axis] + ((raw - smoothed[axis] + bias) >> shift)
+            smoothed[axis] = raw
+            raw = (raw + 128) >> 8
+
+            # Calibration, with a separate scale on each side of the center.
+            offset = raw - self._center[axis]
+            if offset >= 0:
+                span = self._maximum[axis] - self._center[axis]
+                value = min(127, offset * 127 // span)
+            else:
+                span = self._center[axis] - self._minimum[axis]
+                value = -min(127, -offset * 127 // span)
+
+            # Deadzone, harder to leave than to enter.
+            last = values[axis]
+            magnitude = value if value >= 0 else -value
+            if magnitude <= deadzone + (self.hysteresis if last == 0 else 0):
+                value = 0
+            elif deadzone:
+                magnitude = (magnitude - deadzone) * 127 // (127 - deadzone)
+                value = magnitude if value > 0 else -magnitude
+
+            # Minimum change, except to reach the center and the ends.
+            if value != last:
+                delta = value - last
+                if delta >= threshold or -delta >= threshold or value in (0, 127, -127):
+                    values[axis] = value
+                    changed = True
+            axis += 1
+        self._primed = True
+        return changed
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.code_names`
+====================================================
+
+Look up `Keycode` and `ConsumerControlCode` values by name, and names by value,
+such as to read key names from a configuration file or to log the keys sent.
+
+Example::
+
+    from adafruit_hid.code_names import KEYCODE_NAMES
+
+    KEYCODE_NAMES.code("LEFT_CONTROL")  # 0xE0
+    KEYCODE_NAMES.code("control")  # 0xE0, names are not case sensitive
+    KEYCODE_NAMES.name(0xE0)  # "LEFT_CONTROL", aliases are never returned
+"""
+
+from .consumer_control_code import ConsumerControlCode
+from .keycode import Keycode
+
+try:
+    from typing import Tuple
+except ImportError:
+    pass
+
+
+class CodeNames:
+    """Index of the names and values of the integer constants of a class, built on the
+    first lookup, so that importing this module costs almost nothing until it is used.
+
+    :param codes: the class of the constants, such as `Keycode`.
+    :param aliases: names that are alternatives to other names with the same value,
+      and that `name()` must not return.
+    """
+
+    def __init__(self, codes: type, aliases: Tuple[str, ...] = ()) -> None:
+        self._class = codes
+        self._aliases = aliases
+        self._codes = None
+        self._names = None
+
+    def _build(self) -> None:
+        codes = {}
+        names = {}
+        # Skipping the aliases makes the name of each value independent of the order of dir().
+        for name in dir(self._class):
+            if name[0] == "_":
+                continue
+            code = getattr(self._class, name)
+            if not isinstance(code, int):
+                continue
+            codes[name] = code
+            if name not in self._aliases and code not in names:
+                names[code] = name
+        self._codes = codes
+        self._names = names
+
+    def code(self, name: str) -> int:
+        """Return the value with the given name, or alias.
+
+        :param name: the name of the constant, such as ``"F13"``, in any case.
+        :raises ValueError: if there is no such name.
+        """
+        if self._codes is None:
+            self._build()
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes.get(name.upper())
+            if code is None:
+                raise ValueError("Unknown name: {}".format(name))
+        return code
+
+    def name(self, code: int) -> str:
+        """Return the name of the given value, never an alias.
+
+        :raises ValueError: if no constant has this value.
+        """
+        if self._names is None:
+            self._build()
+        name = self._names.get(code)
+        if name is None:
+            raise ValueError("Unknown code: {}".format(code))
+        return name
+
+    def __contains__(self, name: str) -> bool:
+        if self._codes is None:
+            self._build()
+        return name in self._codes or name.upper() in self._codes
+
+
+KEYCODE_NAMES = CodeNames(
+    Keycode,
+    aliases=(
+        "ALT",
+        "COMMAND",
+        "CONTROL",
+        "GUI",
+        "OPTION",
+        "RETURN",
+        "SHIFT",
+        "SPACE",
+        "WINDOWS",
+    ),
+)
+"""Names of the `Keycode` values. ``SHIFT``, ``CONTROL``, ``ALT``, ``GUI``, ``COMMAND``,
+``OPTION``, ``WINDOWS``, ``RETURN`` and ``SPACE`` are aliases of other keycodes."""
+
+CONSUMER_CONTROL_CODE_NAMES = CodeNames(ConsumerControlCode)
+"""Names of the `ConsumerControlCode` values."""
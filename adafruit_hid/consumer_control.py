@@ -18,7 +18,7 @@ if sys.implementation.version[0] < 3:
 
 # pylint: disable=wrong-import-position
 import struct
-from . import find_device
+from . import _deduplicated, _suppressed_reports_property, find_device
 
 try:
     from typing import Sequence
@@ -30,11 +30,19 @@ except ImportError:
 class ConsumerControl:
     """Send ConsumerControl code reports, used by multimedia keyboards, remote controls, etc."""
 
-    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        *,
+        deduplicate: bool = False,
+    ) -> None:
         """Create a ConsumerControl object that will send Consumer Control Device HID reports.
 
         :param timeout: Time in seconds to wait for USB to become ready before timing out.
           Defaults to None to wait indefinitely.
+        :param deduplicate: if ``True``, do not send reports identical to the last one sent,
+          such as a release when nothing is pressed. See `suppressed_reports`.
 
         Devices can be a sequence of devices that includes a Consumer Control device or a CC device
         itself. A device is any object that implements ``send_report()``, ``usage_page`` and
@@ -43,6 +51,7 @@ class ConsumerControl:
         self._consumer_device = find_device(
             devices, usage_page=0x0C, usage=0x01, timeout=timeout
         )
+        self._consumer_device = _deduplicated(self._consumer_device, deduplicate)
 
         # Reuse this bytearray to send consumer reports.
         self._report = bytearray(2)
@@ -100,3 +109,27 @@ class ConsumerControl:
         """
         self._report[0] = self._report[1] = 0x0
         self._consumer_device.send_report(self._report)
+
+    async def hold(self, consumer_code: int, seconds: float) -> None:
+        """Press the given consumer control key, hold it for the given time while yielding
+        to the asyncio event loop, then release it. Requires the ``asyncio`` library.
+
+        :param consumer_code: a 16-bit consumer control code.
+        :param float seconds: how long to hold the key.
+
+        Examples::
+
+            from adafruit_hid.consumer_control_code import ConsumerControlCode
+
+            # Raise volume for 0.5 seconds, while other tasks keep running
+            await consumer_control.hold(ConsumerControlCode.VOLUME_INCREMENT, 0.5)
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.press(consumer_code)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            self.release()
+
+    suppressed_reports = _suppressed_reports_property("_consumer_device")
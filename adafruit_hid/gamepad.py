@@ -0,0 +1,352 @@
+# SPDX-FileCopyrightText: 2018 Dan Halbert for Adafruit Industries
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.gamepad.Gamepad`
+====================================================
+
+* Author(s): Dan Halbert
+"""
+
+import time
+
+from . import find_device
+
+try:
+    from typing import Optional, Sequence
+    import usb_hid
+    from .axis_conditioner import AxisConditioner
+except ImportError:
+    pass
+
+_AXIS_USAGES = b"\x30\x31\x32\x35\x33\x34\x36\x37"
+"""Usages of the axes, in report order: X, Y, Z, Rz, Rx, Ry, Slider and Dial."""
+
+MAX_BUTTONS = 128
+"""Largest number of buttons of a `Gamepad`."""
+MAX_AXES = len(_AXIS_USAGES)
+"""Largest number of axes of a `Gamepad`."""
+
+
+def _check_sizes(buttons: int, axes: int) -> None:
+    if not 1 <= buttons <= MAX_BUTTONS:
+        raise ValueError(
+            "Number of buttons must be in range 1 to {}".format(MAX_BUTTONS)
+        )
+    if not 0 <= axes <= MAX_AXES:
+        raise ValueError("Number of axes must be in range 0 to {}".format(MAX_AXES))
+
+
+def report_length(buttons: int = 16, axes: int = 4) -> int:
+    """Return the length of the reports of a gamepad: one bit per button, padded to
+    a whole byte, followed by one byte per axis.
+
+    :param int buttons: number of buttons, from 1 to `MAX_BUTTONS`.
+    :param int axes: number of axes, from 0 to `MAX_AXES`.
+    """
+    _check_sizes(buttons, axes)
+    return (buttons + 7) // 8 + axes
+
+
+def report_descriptor(buttons: int = 16, axes: int = 4, report_id: int = 5) -> bytes:
+    """Return the HID report descriptor of a gamepad with the given number of buttons
+    and axes. The axes are, in order, X, Y, Z, Rz, Rx, Ry, Slider and Dial, each going
+    from -127 to 127. The defaults match the gamepad descriptor of the
+    `Learn Guide <https://learn.adafruit.com/customizing-usb-devices-in-circuitpython>`_.
+
+    :param int buttons: number of buttons, from 1 to `MAX_BUTTONS`.
+    :param int axes: number of axes, from 0 to `MAX_AXES`.
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+    """
+    _check_sizes(buttons, axes)
+    descriptor = bytearray(
+        b"\x05\x01"  # Usage Page (Generic Desktop)
+        b"\x09\x05"  # Usage (Game Pad)
+        b"\xa1\x01"  # Collection (Application)
+        b"\x85\x05"  #   Report ID
+        b"\x05\x09"  #   Usage Page (Button)
+        b"\x19\x01"  #   Usage Minimum (Button 1)
+        b"\x29\x10"  #   Usage Maximum
+        b"\x15\x00"  #   Logical Minimum (0)
+        b"\x25\x01"  #   Logical Maximum (1)
+        b"\x75\x01"  #   Report Size (1)
+        b"\x95\x10"  #   Report Count
+        b"\x81\x02"  #   Input (Data, Variable, Absolute)
+    )
+    descriptor[7] = report_id
+    descriptor[13] = buttons
+    descriptor[21] = buttons
+    if buttons % 8:
+        descriptor.extend(
+            b"\x75\x01"  #   Report Size (1)
+            b"\x95\x00"  #   Report Count
+            b"\x81\x01"  #   Input (Constant)
+        )
+        descriptor[-3] = 8 - buttons % 8
+    if axes:
+        descriptor.extend(b"\x05\x01")  #   Usage Page (Generic Desktop)
+        for usage in _AXIS_USAGES[:axes]:
+            descriptor.extend(b"\x09")  #   Usage (axis)
+            descriptor.append(usage)
+        descriptor.extend(
+            b"\x15\x81"  #   Logical Minimum (-127)
+            b"\x25\x7f"  #   Logical Maximum (127)
+            b"\x75\x08"  #   Report Size (8)
+            b"\x95\x04"  #   Report Count
+            b"\x81\x02"  #   Input (Data, Variable, Absolute)
+        )
+        descriptor[-3] = axes
+    descriptor.extend(b"\xc0")  # End Collection
+    return bytes(descriptor)
+
+
+def create_device(
+    buttons: int = 16, axes: int = 4, report_id: int = 5
+) -> usb_hid.Device:
+    """Return a ``usb_hid.Device`` for a gamepad, to enable in ``boot.py``.
+
+    :param int buttons: number of buttons, from 1 to `MAX_BUTTONS`.
+    :param int axes: number of axes, from 0 to `MAX_AXES`.
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+
+    Example::
+
+        # boot.py
+        import usb_hid
+        from adafruit_hid.gamepad import create_device
+
+        usb_hid.enable((usb_hid.Device.KEYBOARD, create_device(buttons=12, axes=2)))
+
+        # code.py
+        gp = Gamepad(usb_hid.devices, buttons=12, axes=2)
+    """
+    import usb_hid  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    return usb_hid.Device(
+        report_descriptor=report_descriptor(buttons, axes, report_id),
+        usage_page=0x01,
+        usage=0x05,
+        report_ids=(report_id,),
+        in_report_lengths=(report_length(buttons, axes),),
+        out_report_lengths=(0,),
+    )
+
+
+class Gamepad:
+    """Emulate a generic gamepad controller with buttons numbered from 1, and axes
+    numbered from 0. By default, there are 16 buttons and four axes making two joysticks,
+    one controlling ``x`` and ``y`` values, and the other controlling ``z`` and
+    ``r_z`` (z rotation or ``Rz``) values.
+
+    The joystick values could be interpreted
+    differently by the receiving program: those are just the names used here.
+    The joystick values are in the range -127 to 127.
+
+    Setters write straight into the report and only mark it as changed when a byte
+    actually differs, so a report is sent only when something changed, without
+    packing or comparing whole reports."""
+
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        *,
+        buttons: int = 16,
+        axes: int = 4,
+        conditioner: AxisConditioner = None,
+    ) -> None:
+        """Create a Gamepad object that will send USB gamepad HID reports.
+
+        :param timeout: Time in seconds to wait for USB to become ready before timing out.
+          Defaults to None to wait indefinitely.
+        :param int buttons: number of buttons of the device, from 1 to `MAX_BUTTONS`.
+        :param int axes: number of axes of the device, from 0 to `MAX_AXES`.
+        :param conditioner: an `AxisConditioner` that `update_axes()` uses to turn
+          raw analog readings into axis values.
+
+        Devices can be a sequence of devices that includes a gamepad device or a gamepad
+        device itself. A device is any object that implements ``send_report()``,
+        ``usage_page`` and ``usage``.
+        """
+        self._gamepad_device = find_device(
+            devices, usage_page=0x1, usage=0x05, timeout=timeout
+        )
+        self.buttons = buttons
+        """Number of buttons of the gamepad."""
+        self.axes = axes
+        """Number of axes of the gamepad."""
+        self.conditioner = conditioner
+        """The `AxisConditioner` used by `update_axes()`, or ``None``."""
+
+        # Reuse this bytearray to send gamepad reports.
+        # Typically controllers start numbering buttons at 1 rather than 0.
+        # report[0] buttons 1-8 (LSB is button 1)
+        # report[1] buttons 9-16, and so on
+        # report[_axis_offset + n] axis n: -127 to 127
+        self._report = bytearray(report_length(buttons, axes))
+        self._axis_offset = (buttons + 7) // 8
+        # True when the report differs from the last one sent.
+        self._dirty = False
+
+        # Send an initial report to test if HID device is ready.
+        # If not, wait a bit and try once more.
+        try:
+            self.reset_all()
+        except OSError:
+            time.sleep(1)
+            self.reset_all()
+
+    def press_buttons(self, *buttons: int) -> None:
+        """Press and hold the given buttons."""
+        report = self._report
+        for button in buttons:
+            index = self._button_index(button)
+            value = report[index >> 3] | 1 << (index & 7)
+            index >>= 3
+            if value != report[index]:
+                report[index] = value
+                self._dirty = True
+        self._send()
+
+    def release_buttons(self, *buttons: int) -> None:
+        """Release the given buttons."""
+        report = self._report
+        for button in buttons:
+            index = self._button_index(button)
+            value = report[index >> 3] & ~(1 << (index & 7))
+            index >>= 3
+            if value != report[index]:
+                report[index] = value
+                self._dirty = True
+        self._send()
+
+    def release_all_buttons(self) -> None:
+        """Release all the buttons."""
+        report = self._report
+        index = 0
+        while index < self._axis_offset:
+            if report[index]:
+                report[index] = 0
+                self._dirty = True
+            index += 1
+        self._send()
+
+    def click_buttons(self, *buttons: int) -> None:
+        """Press and release the given buttons."""
+        self.press_buttons(*buttons)
+        self.release_buttons(*buttons)
+
+    def move_joysticks(
+        self,
+        x: Optional[int] = None,
+        y: Optional[int] = None,
+        z: Optional[int] = None,
+        r_z: Optional[int] = None,
+    ) -> None:
+        """Set and send the given joystick values.
+        The joysticks will remain set with the given values until changed
+
+        One joystick provides ``x`` and ``y`` values, axes 0 and 1,
+        and the other provides ``z`` and ``r_z`` (z rotation), axes 2 and 3.
+        Any values left as ``None`` will not be changed.
+
+        All values must be in the range -127 to 127 inclusive.
+
+        Examples::
+
+            # Change x and y values only.
+            gp.move_joysticks(x=100, y=-50)
+
+            # Reset all joystick values to center position.
+            gp.move_joysticks(0, 0, 0, 0)
+        """
+        if x is not None:
+            self._set_axis(0, x)
+        if y is not None:
+            self._set_axis(1, y)
+        if z is not None:
+            self._set_axis(2, z)
+        if r_z is not None:
+            self._set_axis(3, r_z)
+        self._send()
+
+    def move_axes(self, *values: Optional[int]) -> None:
+        """Set and send the values of the axes, starting from axis 0.
+        Any values given as ``None`` will not be changed.
+
+        All values must be in the range -127 to 127 inclusive.
+
+        Example::
+
+            # Set axes 0 and 4, leaving the others unchanged.
+            gp.move_axes(-20, None, None, None, 127)
+        """
+        axis = 0
+        while axis < len(values):
+            if values[axis] is not None:
+                self._set_axis(axis, values[axis])
+            axis += 1
+        self._send()
+
+    def update_axes(self, readings: Sequence[int]) -> None:
+        """Condition raw analog readings with `conditioner`, one per axis starting
+        from axis 0, and send a report only if the conditioned values changed.
+
+        Example::
+
+            gp.update_axes((ax.value, ay.value))
+        """
+        conditioner = self.conditioner
+        if conditioner is None:
+            raise ValueError("update_axes() needs a conditioner")
+        if conditioner.update(readings):
+            values = conditioner.values
+            axis = 0
+            while axis < len(values):
+                self._set_axis(axis, values[axis])
+                axis += 1
+            self._send()
+
+    def reset_all(self) -> None:
+        """Release all buttons and set joysticks to zero."""
+        if self.conditioner is not None:
+            self.conditioner.reset()
+        report = self._report
+        index = 0
+        while index < len(report):
+            report[index] = 0
+            index += 1
+        self._dirty = True
+        self._send()
+
+    def _send(self) -> None:
+        """Send a report with all the existing settings, only if there have been changes."""
+        if self._dirty:
+            self._gamepad_device.send_report(self._report)
+            self._dirty = False
+
+    def _set_axis(self, axis: int, value: int) -> None:
+        """Store the value of an axis in the report, without sending it."""
+        if not 0 <= axis < self.axes:
+            raise ValueError(
+                "Axis number must be in range 0 to {}".format(self.axes - 1)
+            )
+        if not -127 <= value <= 127:
+            raise ValueError("Joystick value must be in range -127 to 127")
+        value &= 0xFF
+        index = self._axis_offset + axis
+        if self._report[index] != value:
+            self._report[index] = value
+            self._dirty = True
+
+    def _button_index(self, button: int) -> int:
+        """Return the bit index of a button in the report."""
+        if not 1 <= button <= self.buttons:
+            raise ValueError(
+                "Button number must be in range 1 to {}".format(self.buttons)
+            )
+        return button - 1
@@ -9,15 +9,15 @@
 * Author(s): Scott Shawcroft, Dan Halbert
 """
 
+from time import sleep
 from micropython import const
-import usb_hid
 
-from .keycode import Keycode
-
-from . import find_device
+from .keycode import KEYCODE_FLAGS, KEYCODE_MODIFIER, KEYCODE_REGULAR, MODIFIER_BITS
+from . import _deduplicated, _suppressed_reports_property, find_device
 
 try:
     from typing import Sequence
+    import usb_hid
 except:  # pylint: disable=bare-except
     pass
 
@@ -38,11 +38,19 @@ class Keyboard:
 
     # No more than _MAX_KEYPRESSES regular keys may be pressed at once.
 
-    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        *,
+        deduplicate: bool = False,
+    ) -> None:
         """Create a Keyboard object that will send keyboard HID reports.
 
         :param timeout: Time in seconds to wait for USB to become ready before timing out.
           Defaults to None to wait indefinitely.
+        :param deduplicate: if ``True``, do not send reports identical to the last one sent,
+          such as pressing a key already pressed. See `suppressed_reports`.
 
         Devices can be a sequence of devices that includes a keyboard device or a keyboard device
         itself. A device is any object that implements ``send_report()``, ``usage_page`` and
@@ -51,6 +59,7 @@ class Keyboard:
         self._keyboard_device = find_device(
             devices, usage_page=0x1, usage=0x06, timeout=timeout
         )
+        self._keyboard_device = _deduplicated(self._keyboard_device, deduplicate)
 
         # Reuse this bytearray to send keyboard reports.
         self.report = bytearray(8)
@@ -91,8 +100,38 @@ class Keyboard:
             # Press a, b, c keys all at once.
             kbd.press(Keycode.A, Keycode.B, Keycode.C)
         """
-        for keycode in keycodes:
-            self._add_keycode_to_report(keycode)
+        self.press_keys(keycodes)
+
+    def press_key(self, keycode: int) -> None:
+        """Send a report indicating that the given key has been pressed.
+        Unlike `press()`, this does not allocate any memory.
+
+        :param keycode: Press this keycode, a modifier or a regular key.
+        """
+        self._add_keycode_to_report(keycode)
+        self._keyboard_device.send_report(self.report)
+
+    def press_keys(self, keycodes: Sequence[int]) -> None:
+        """Send a report indicating that the given keys have been pressed.
+        Unlike `press()`, the keycodes are given as a sequence, such as a preallocated
+        bytearray, so that pressing keys repeatedly does not allocate any memory.
+
+        :param keycodes: Press these keycodes all at once.
+
+        Example::
+
+            # Preallocate the keycodes once.
+            copy_keys = bytes((Keycode.CONTROL, Keycode.C))
+            while True:
+                if button.value:
+                    kbd.press_keys(copy_keys)
+                    kbd.release_keys(copy_keys)
+        """
+        # Index instead of iterating, so that no iterator object is created.
+        i = 0
+        while i < len(keycodes):
+            self._add_keycode_to_report(keycodes[i])
+            i += 1
         self._keyboard_device.send_report(self.report)
 
     def release(self, *keycodes: int) -> None:
@@ -107,14 +146,36 @@ class Keyboard:
             # release SHIFT key
             kbd.release(Keycode.SHIFT)
         """
-        for keycode in keycodes:
-            self._remove_keycode_from_report(keycode)
+        self.release_keys(keycodes)
+
+    def release_key(self, keycode: int) -> None:
+        """Send a report indicating that the given key has been released.
+        Unlike `release()`, this does not allocate any memory.
+
+        :param keycode: Release this keycode. It is ignored if it was not pressed.
+        """
+        self._remove_keycode_from_report(keycode)
+        self._keyboard_device.send_report(self.report)
+
+    def release_keys(self, keycodes: Sequence[int]) -> None:
+        """Send a report indicating that the given keys have been released.
+        Like `press_keys()`, this takes a sequence of keycodes and does not allocate any memory.
+
+        :param keycodes: Release these keycodes all at once.
+        """
+        i = 0
+        while i < len(keycodes):
+            self._remove_keycode_from_report(keycodes[i])
+            i += 1
         self._keyboard_device.send_report(self.report)
 
     def release_all(self) -> None:
         """Release all pressed keys."""
-        for i in range(8):
-            self.report[i] = 0
+        report = self.report
+        i = 0
+        while i < len(report):
+            report[i] = 0
+            i += 1
         self._keyboard_device.send_report(self.report)
 
     def send(self, *keycodes: int) -> None:
@@ -125,16 +186,157 @@ class Keyboard:
         self.press(*keycodes)
         self.release_all()
 
+    def send_reports(
+        self, reports: bytes, delay: float = None, *, continued: bool = False
+    ) -> None:
+        """Send a sequence of prebuilt keyboard reports, such as the ones returned by
+        `KeyboardLayoutBase.compile()`.
+
+        :param reports: consecutive 8-byte keyboard reports.
+        :param float delay: Optional delay in seconds before each report pressing a new key.
+          The keys that this report releases are released before the delay, keeping the
+          modifiers held, so that they are not held long enough to repeat on the host.
+        :param bool continued: ``True`` if the reports continue the ones just sent, so that
+          the delay also applies before the first report.
+
+        The keyboard state is left as set by the last report, normally with all keys released.
+        """
+        # Reports are walked by offset: slicing them would allocate.
+        start = 0
+        while start < len(reports):
+            if (
+                delay is not None
+                and (start or continued)
+                and self._release_before_new_key(reports, start)
+            ):
+                sleep(delay)
+            self._send_boot_report(reports, start)
+            start += 8
+
+    async def send_reports_async(
+        self, reports: bytes, delay: float = None, *, continued: bool = False
+    ) -> None:
+        """Like `send_reports()`, but yield to the asyncio event loop between reports
+        instead of blocking, so other tasks keep running. Requires the ``asyncio`` library.
+
+        :param reports: consecutive 8-byte keyboard reports.
+        :param float delay: Optional delay in seconds before each report pressing a new key.
+        :param bool continued: ``True`` if the reports continue the ones just sent.
+
+        Example::
+
+            await kbd.send_reports_async(layout.compile("Hello"), 0.05)
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        start = 0
+        while start < len(reports):
+            if start or continued:
+                pause = 0
+                if delay is not None and self._release_before_new_key(reports, start):
+                    pause = delay
+                await asyncio.sleep(pause)
+            self._send_boot_report(reports, start)
+            start += 8
+
+    def _release_before_new_key(self, reports: bytes, start: int) -> bool:
+        """If the 8-byte boot keyboard report at offset ``start`` of ``reports`` presses
+        a new regular key, release the keys that it does not press, so that the delay
+        before it does not hold them long enough to repeat.
+
+        :returns: ``True`` if the report presses a new key.
+        """
+        if not self._presses_new_key(reports, start):
+            return False
+        if self._release_keys_not_in(reports, start):
+            self._keyboard_device.send_report(self.report)
+        return True
+
+    def _send_boot_report(self, reports: bytes, start: int) -> None:
+        """Send the 8-byte boot keyboard report at offset ``start`` of ``reports``."""
+        self._load_boot_report(reports, start)
+        self._keyboard_device.send_report(self.report)
+
+    def _holds_key(self, keycode: int) -> bool:
+        """Return ``True`` if the regular key is pressed in the report."""
+        report_keys = self.report_keys
+        i = 0
+        while i < _MAX_KEYPRESSES:
+            if report_keys[i] == keycode:
+                return True
+            i += 1
+        return False
+
+    def _presses_new_key(self, reports: bytes, start: int) -> bool:
+        """Return ``True`` if the 8-byte boot keyboard report at offset ``start`` of
+        ``reports`` presses a regular key that is not pressed in the report."""
+        i = start + 2
+        while i < start + 8:
+            keycode = reports[i]
+            if keycode and not self._holds_key(keycode):
+                return True
+            i += 1
+        return False
+
+    def _release_keys_not_in(self, reports: bytes, start: int) -> bool:
+        """Remove from the report the regular keys that the 8-byte boot keyboard report
+        at offset ``start`` of ``reports`` does not press, keeping the modifiers.
+
+        :returns: ``True`` if any key was removed.
+        """
+        report_keys = self.report_keys
+        i = j = 0
+        while i < _MAX_KEYPRESSES and report_keys[i]:
+            keycode = report_keys[i]
+            k = start + 2
+            while k < start + 8 and reports[k] != keycode:
+                k += 1
+            if k < start + 8:
+                report_keys[j] = keycode
+                j += 1
+            i += 1
+        released = j < i
+        while j < i:
+            report_keys[j] = 0
+            j += 1
+        return released
+
+    def _load_boot_report(self, reports: bytes, start: int) -> None:
+        """Set the report to the keys of the 8-byte boot keyboard report at offset
+        ``start`` of ``reports``."""
+        report = self.report
+        i = 0
+        while i < 8:
+            report[i] = reports[start + i]
+            i += 1
+
+    @staticmethod
+    def _keycode_flags(keycode: int) -> int:
+        """Return the `KEYCODE_FLAGS` of a modifier or regular keycode.
+
+        :raises ValueError: if the keycode cannot be sent in the report.
+        """
+        try:
+            flags = KEYCODE_FLAGS[keycode]
+        except IndexError:
+            flags = 0
+        if not flags & (KEYCODE_MODIFIER | KEYCODE_REGULAR) or keycode < 0:
+            raise ValueError("Invalid keycode: {}".format(keycode))
+        return flags
+
     def _add_keycode_to_report(self, keycode: int) -> None:
         """Add a single keycode to the USB HID report."""
-        modifier = Keycode.modifier_bit(keycode)
-        if modifier:
+        flags = self._keycode_flags(keycode)
+        if flags & KEYCODE_MODIFIER:
             # Set bit for this modifier.
-            self.report_modifier[0] |= modifier
+            self.report_modifier[0] |= MODIFIER_BITS[keycode]
         else:
             report_keys = self.report_keys
+            # Loops use indexes rather than range() iterators, so that pressing
+            # a key does not allocate any memory.
             # Don't press twice.
-            for i in range(_MAX_KEYPRESSES):
+            i = 0
+            while i < _MAX_KEYPRESSES:
                 report_key = report_keys[i]
                 if report_key == 0:
                     # Put keycode in first empty slot. Since the report_keys
@@ -144,35 +346,40 @@ class Keyboard:
                 if report_key == keycode:
                     # Already pressed.
                     return
+                i += 1
             # All slots are filled. Shuffle down and reuse last slot
-            for i in range(_MAX_KEYPRESSES - 1):
+            i = 0
+            while i < _MAX_KEYPRESSES - 1:
                 report_keys[i] = report_keys[i + 1]
+                i += 1
             report_keys[-1] = keycode
 
     def _remove_keycode_from_report(self, keycode: int) -> None:
         """Remove a single keycode from the report."""
-        modifier = Keycode.modifier_bit(keycode)
-        if modifier:
+        flags = self._keycode_flags(keycode)
+        if flags & KEYCODE_MODIFIER:
             # Turn off the bit for this modifier.
-            self.report_modifier[0] &= ~modifier
+            self.report_modifier[0] &= ~MODIFIER_BITS[keycode]
         else:
             report_keys = self.report_keys
             # Clear the at most one matching slot and move remaining keys down
-            j = 0
-            for i in range(_MAX_KEYPRESSES):
+            i = j = 0
+            while i < _MAX_KEYPRESSES:
                 pressed = report_keys[i]
                 if not pressed:
                     break  # Handled all used report slots
-                if pressed == keycode:
-                    continue  # Remove this entry
-                if i != j:
-                    report_keys[j] = report_keys[i]
-                j += 1
+                if pressed != keycode:  # Otherwise remove this entry
+                    if i != j:
+                        report_keys[j] = report_keys[i]
+                    j += 1
+                i += 1
             # Clear any remaining slots
             while j < _MAX_KEYPRESSES and report_keys[j]:
                 report_keys[j] = 0
                 j += 1
 
+    suppressed_reports = _suppressed_reports_property("_keyboard_device")
+
     @property
     def led_status(self) -> bytes:
         """Returns the last received report"""
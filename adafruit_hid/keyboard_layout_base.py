@@ -9,18 +9,70 @@
 * Author(s): Dan Halbert, AngainorDev, Neradoc
 """
 
+from micropython import const
 
 try:
-    from typing import Tuple
+    from typing import Dict, Iterator, List, Optional, Tuple
     from .keyboard import Keyboard
 except ImportError:
     pass
 
-from time import sleep
-
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_HID.git"
 
+# Character index of each layout class, built on first use.
+_char_indexes = {}
+
+# Flags of the characters in KEYCODE_TABLE.
+_TABLE_ALTGR = const(0x01)
+_TABLE_DEAD = const(0x02)
+
+# Characters compiled at once by write(), so that strings whose reports do not fit
+# in the report cache are sent part by part.
+_WRITE_CHUNK = const(8)
+
+
+class ReportCache:
+    """Least recently used cache of compiled report streams, bounded by the total
+    number of bytes it holds.
+
+    :param int max_bytes: the maximum number of bytes of reports kept in the cache.
+      Entries larger than this are never cached.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        """Number of bytes currently held in the cache."""
+        self._entries = {}
+        # Keys from least to most recently used.
+        self._order = []
+
+    def get(self, key: object) -> Optional[bytes]:
+        """Return the reports cached for ``key``, or ``None``."""
+        reports = self._entries.get(key)
+        if reports is not None and self._order[-1] != key:
+            self._order.remove(key)
+            self._order.append(key)
+        return reports
+
+    def put(self, key: object, reports: bytes) -> None:
+        """Cache ``reports`` for ``key``, evicting the least recently used entries
+        if needed to stay within `max_bytes`."""
+        if len(reports) > self.max_bytes or key in self._entries:
+            return
+        while self._order and self.size + len(reports) > self.max_bytes:
+            self.size -= len(self._entries.pop(self._order.pop(0)))
+        self._entries[key] = reports
+        self._order.append(key)
+        self.size += len(reports)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        self._entries.clear()
+        self._order.clear()
+        self.size = 0
+
 
 class KeyboardLayoutBase:
     """Base class for keyboard layouts. Uses the tables defined in the subclass
@@ -60,11 +112,51 @@ class KeyboardLayoutBase:
     ``A`` is the altgr flag for the **first** key,
     ``KKK KKKK`` is the (low) ASCII code for the second character.
     """
+    KEYCODE_TABLE = b""
+    """
+    Packed bytes table of all the characters of the layout, as made by
+    ``tools/layout_compiler.py``. When set, it is used instead of the other tables,
+    and stays in flash memory when the layout is in a .mpy file.
+
+    The table is made of:
+    the number N of characters and the number D of dead-key combinations (2-bytes little endian
+    ints), then the N ord() values of the characters in increasing order (2-bytes little endian
+    ints), then N keycode bytes (using the `SHIFT_FLAG` if needed), then N flag bytes,
+    then D 2-bytes dead-key combinations, coded like the `COMBINED_KEYS` values (big endian).
+    Characters typed with a dead key have the dead key flag and the index of their
+    combination instead of a keycode.
+    """
 
-    def __init__(self, keyboard: Keyboard) -> None:
+    TYPING_CLASSIC = 0
+    """`typing_mode` pressing altgr, shift and the key in separate reports,
+    then releasing all keys, for each character."""
+    TYPING_FAST = 1
+    """`typing_mode` pressing the modifiers and the key in a single report, which also
+    releases the previous key, and keeping the modifiers held across consecutive characters
+    that need the same ones. This takes one report per character, plus one for each
+    repeated key. With a delay, each key is released before waiting, so it is not held
+    during the delay."""
+    TYPING_ROLLOVER = 2
+    """`typing_mode` keeping up to six keys held, like a fast typist: each character adds
+    its key to the report, and a key is only released when it is typed again, when the
+    six slots are full, or by the final release. Modifier changes are sent with the next key.
+    Only use it with short delays, as held keys may start repeating on the host."""
+    TYPING_ROLLOVER_STRICT = 3
+    """`typing_mode` like `TYPING_ROLLOVER`, but guaranteeing that the host sees the
+    characters in order: keys are only ever added after the ones already held, and
+    all the keys are released at once before a key is reused or the modifiers change."""
+
+    report_cache = ReportCache(1024)
+    """`ReportCache` of the strings compiled by all the layouts. Its byte budget can be
+    changed with ``KeyboardLayoutBase.report_cache.max_bytes``."""
+
+    def __init__(self, keyboard: Keyboard, typing_mode: int = TYPING_CLASSIC) -> None:
         """Specify the layout for the given keyboard.
 
         :param keyboard: a Keyboard object. Write characters to this keyboard when requested.
+        :param typing_mode: how characters are turned into reports: `TYPING_CLASSIC`,
+          `TYPING_FAST`, `TYPING_ROLLOVER` or `TYPING_ROLLOVER_STRICT`.
+          Can be changed later with the ``typing_mode`` attribute.
 
         Example::
 
@@ -72,26 +164,301 @@ class KeyboardLayoutBase:
             layout = KeyboardLayout(kbd)
         """
         self.keyboard = keyboard
+        self.typing_mode = typing_mode
 
-    def _write(self, keycode: int, altgr: bool = False) -> None:
-        """Type a key combination based on shift bit and altgr bool
+    def _char_index(self) -> Dict[int, Tuple[Tuple[int, ...], ...]]:
+        """Return the index of the characters of this layout, built on first use.
 
-        :param keycode: int value of the keycode, with the shift bit.
-        :param altgr: bool indicating if the altgr key should be pressed too.
+        The index maps the ord() value of every character that can be typed to a tuple of
+        key combinations to type one after the other, each one a tuple of keycodes: one
+        combination for most characters, two for the ones typed with a dead key.
         """
-        # Add altgr modifier if needed
-        if altgr:
-            self.keyboard.press(self.RIGHT_ALT_CODE)
-        # If this is a shifted char, clear the SHIFT flag and press the SHIFT key.
+        index = _char_indexes.get(self.__class__)
+        if index is None:
+            index = {}
+            ascii_to_keycode = self.ASCII_TO_KEYCODE
+            for char_val, keycode in enumerate(ascii_to_keycode):
+                if keycode:
+                    index[char_val] = (
+                        self._keycode_tuple(keycode, chr(char_val) in self.NEED_ALTGR),
+                    )
+            # A character can be indexed by the char itself or its int ord() value,
+            # the int value taking precedence.
+            for char, keycode in sorted(
+                self.HIGHER_ASCII.items(), key=lambda item: isinstance(item[0], int)
+            ):
+                char_val = char if isinstance(char, int) else ord(char)
+                if char_val >= len(ascii_to_keycode):
+                    index[char_val] = (
+                        self._keycode_tuple(keycode, chr(char_val) in self.NEED_ALTGR),
+                    )
+            for char_val, cchar in self.COMBINED_KEYS.items():
+                if char_val not in index:
+                    index[char_val] = (
+                        # first key (including shift bit)
+                        self._keycode_tuple(cchar >> 8, cchar & self.ALTGR_FLAG),
+                        # second key (removing the altgr bit),
+                        # assume no altgr needed for second key
+                        self._keycode_tuple(
+                            ascii_to_keycode[cchar & 0xFF & (~self.ALTGR_FLAG)], False
+                        ),
+                    )
+            _char_indexes[self.__class__] = index
+        return index
+
+    def _keycode_tuple(self, keycode: int, altgr: bool) -> Tuple[int, ...]:
+        """Return the keycodes to press for a keycode with the shift bit and the altgr bool."""
         if keycode & self.SHIFT_FLAG:
-            keycode &= ~self.SHIFT_FLAG
-            self.keyboard.press(self.SHIFT_CODE)
-        self.keyboard.press(keycode)
-        self.keyboard.release_all()
+            keycodes = (self.SHIFT_CODE, keycode & ~self.SHIFT_FLAG)
+        else:
+            keycodes = (keycode,)
+        if altgr:
+            keycodes = (self.RIGHT_ALT_CODE,) + keycodes
+        return keycodes
+
+    def _table_find(self, char_val: int) -> int:
+        """Return the position of the character in `KEYCODE_TABLE`, or -1."""
+        table = self.KEYCODE_TABLE
+        low = 0
+        high = table[0] | table[1] << 8
+        while low < high:
+            middle = (low + high) >> 1
+            found = table[4 + 2 * middle] | table[5 + 2 * middle] << 8
+            if found < char_val:
+                low = middle + 1
+            elif found > char_val:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def _table_combinations(
+        self, char_val: int
+    ) -> Optional[Tuple[Tuple[int, ...], ...]]:
+        """Return the key combinations for the character from `KEYCODE_TABLE`, like
+        `_char_index()` does, or ``None``."""
+        position = self._table_find(char_val)
+        if position < 0:
+            return None
+        table = self.KEYCODE_TABLE
+        count = table[0] | table[1] << 8
+        keycode = table[4 + 2 * count + position]
+        flags = table[4 + 3 * count + position]
+        if not flags & _TABLE_DEAD:
+            return (self._keycode_tuple(keycode, flags & _TABLE_ALTGR),)
+        combination = 4 + 4 * count + 2 * keycode
+        second = self._table_find(table[combination + 1] & ~self.ALTGR_FLAG)
+        return (
+            self._keycode_tuple(
+                table[combination], table[combination + 1] & self.ALTGR_FLAG
+            ),
+            # assume no altgr needed for second key
+            self._keycode_tuple(table[4 + 2 * count + second], False),
+        )
+
+    def _strokes(self, string: str) -> List[int]:
+        """Return the key strokes needed to type the string.
+
+        Each stroke is an int: the modifier byte in the high byte, the keycode in the low byte.
+
+        :raises ValueError: if any of the characters has no keycode.
+        """
+        if self.KEYCODE_TABLE:
+            lookup = self._table_combinations
+        else:
+            lookup = self._char_index().get
+        strokes = []
+        for char in string:
+            combinations = lookup(ord(char))
+            if combinations is None:
+                self._no_keycode(char)
+            for keycodes in combinations:
+                modifier = 0
+                for keycode in keycodes[:-1]:
+                    modifier |= 1 << (keycode - 0xE0)
+                strokes.append(modifier << 8 | keycodes[-1])
+        return strokes
+
+    @staticmethod
+    def _no_keycode(char: str) -> None:
+        """Raise the error for a character that has no keycode."""
+        raise ValueError(
+            "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
+                letter=repr(char), num=ord(char)
+            )
+        )
+
+    def _check_characters(self, string: str) -> None:
+        """Check that all the characters of the string can be typed, without allocating.
+
+        :raises ValueError: if any of the characters has no keycode.
+        """
+        if self.KEYCODE_TABLE:
+            for char in string:
+                if self._table_find(ord(char)) < 0:
+                    self._no_keycode(char)
+        else:
+            index = self._char_index()
+            for char in string:
+                if ord(char) not in index:
+                    self._no_keycode(char)
+
+    def _compile_classic(self, reports: bytearray, strokes: List[int]) -> None:
+        """Press altgr, then shift, then the key, then release everything, for each stroke."""
+        altgr_bit = 1 << (self.RIGHT_ALT_CODE - 0xE0)
+        for stroke in strokes:
+            modifier = stroke >> 8
+            if modifier & altgr_bit:
+                reports.extend((altgr_bit, 0, 0, 0, 0, 0, 0, 0))
+            if modifier & ~altgr_bit:
+                reports.extend((modifier, 0, 0, 0, 0, 0, 0, 0))
+            reports.extend((modifier, 0, stroke & 0xFF, 0, 0, 0, 0, 0))
+            reports.extend(bytes(8))
+
+    @staticmethod
+    def _compile_fast(
+        reports: bytearray, strokes: List[int], state: list, end: bool = True
+    ) -> None:
+        """Press the modifiers with the key, releasing the previous key in the same report
+        unless it is pressed again."""
+        previous = state[0]
+        for stroke in strokes:
+            if stroke & 0xFF == previous & 0xFF:
+                # Same key again: release it first, keeping the modifiers held.
+                reports.extend((previous >> 8, 0, 0, 0, 0, 0, 0, 0))
+            reports.extend((stroke >> 8, 0, stroke & 0xFF, 0, 0, 0, 0, 0))
+            previous = stroke
+        state[0] = previous
+        if end and previous:
+            reports.extend(bytes(8))
+
+    @staticmethod
+    def _compile_rollover(
+        reports: bytearray,
+        strokes: List[int],
+        state: list,
+        end: bool = True,
+        strict: bool = False,
+    ) -> None:
+        """Add each key to the held keys, releasing keys only when they have to be reused."""
+        modifier, held = state
+        for stroke in strokes:
+            keycode = stroke & 0xFF
+            if strict:
+                if held and (
+                    stroke >> 8 != modifier or keycode in held or len(held) == 6
+                ):
+                    reports.extend((modifier, 0, 0, 0, 0, 0, 0, 0))
+                    held.clear()
+            else:
+                if keycode in held:
+                    held.remove(keycode)
+                    reports.extend((modifier, 0))
+                    reports.extend(held)
+                    reports.extend(bytes(6 - len(held)))
+                elif len(held) == 6:
+                    # Release the oldest key in the report that presses the new one.
+                    held.pop(0)
+            modifier = stroke >> 8
+            held.append(keycode)
+            reports.extend((modifier, 0))
+            reports.extend(held)
+            reports.extend(bytes(6 - len(held)))
+        state[0] = modifier
+        if end and held:
+            reports.extend(bytes(8))
+
+    def compile(self, string: str) -> bytes:
+        """Convert the string into the sequence of keyboard reports that types it,
+        using the current `typing_mode`.
+
+        The result is a bytes object made of consecutive 8-byte keyboard reports,
+        that can be sent with `Keyboard.send_reports()`. Compiled strings are kept in
+        `report_cache`, so compiling the same string again is a simple lookup.
+
+        :param string: A string of UTF-8 characters to convert to key presses.
+        :returns: bytes of 8-byte keyboard reports.
+        :raises ValueError: if any of the characters has no keycode
+            (such as some control characters).
+
+        Example::
+
+            # Compile once, type many times
+            login = layout.compile('admin\\n')
+            kbd.send_reports(login)
+        """
+        key = (self.__class__, self.typing_mode, string)
+        reports = self.report_cache.get(key)
+        if reports is None:
+            reports = self._compile(string)
+            self.report_cache.put(key, reports)
+        return reports
+
+    def _compile(self, string: str) -> bytes:
+        """Convert the string into keyboard reports like `compile()`, without caching."""
+        reports = bytearray()
+        self._compile_into(reports, string, [0, []])
+        return bytes(reports)
+
+    def _compile_into(
+        self, reports: bytearray, string: str, state: list, end: bool = True
+    ) -> None:
+        """Add the keyboard reports typing the string to ``reports``.
+
+        :param state: the keys held at the end of the previous part of the text, as
+          ``[modifier or previous stroke, held keys]``, updated for the next part.
+        :param end: ``False`` if more text follows, so that the keys held at the end
+          are not released.
+        """
+        strokes = self._strokes(string)
+        if self.typing_mode == self.TYPING_FAST:
+            self._compile_fast(reports, strokes, state, end)
+        elif self.typing_mode == self.TYPING_ROLLOVER:
+            self._compile_rollover(reports, strokes, state, end)
+        elif self.typing_mode == self.TYPING_ROLLOVER_STRICT:
+            self._compile_rollover(reports, strokes, state, end, strict=True)
+        else:
+            self._compile_classic(reports, strokes)
+
+    def _chunks(self, string: str) -> Iterator[bytes]:
+        """Yield the reports typing the string.
+
+        The string is compiled a few characters at a time, keeping the keys held across
+        the parts. While the reports fit in `report_cache`, they are kept together and
+        cached. Past that, they are yielded part by part, so that the memory used does not
+        grow with the length of the string. All the characters are checked first.
+        """
+        key = (self.__class__, self.typing_mode, string)
+        reports = self.report_cache.get(key)
+        if reports is not None:
+            yield reports
+            return
+        self._check_characters(string)
+        state = [0, []]
+        reports = bytearray()
+        streaming = False
+        start = 0
+        while start < len(string):
+            end = start + _WRITE_CHUNK
+            self._compile_into(reports, string[start:end], state, end >= len(string))
+            start = end
+            if streaming or len(reports) > self.report_cache.max_bytes:
+                streaming = True
+                yield reports
+                reports = bytearray()
+        if not streaming:
+            reports = bytes(reports)
+            self.report_cache.put(key, reports)
+            yield reports
 
     def write(self, string: str, delay: float = None) -> None:
         """Type the string by pressing and releasing keys on my keyboard.
 
+        The string is compiled and cached (see `compile()`) when its reports fit in
+        `report_cache`. Longer strings are sent part by part as they are compiled, so that
+        typing them does not need more memory. All the characters are checked first,
+        so no key is typed if one of them cannot be typed.
+
         :param string: A string of UTF-8 characters to convert to key presses and send.
         :param float delay: Optional delay in seconds between key presses.
         :raises ValueError: if any of the characters has no keycode
@@ -102,30 +469,30 @@ class KeyboardLayoutBase:
             # Write abc followed by Enter to the keyboard
             layout.write('abc\\n')
         """
-        for char in string:
-            # find easy ones first
-            keycode = self._char_to_keycode(char)
-            if keycode > 0:
-                self._write(keycode, char in self.NEED_ALTGR)
-            # find combined keys
-            elif ord(char) in self.COMBINED_KEYS:
-                # first key (including shift bit)
-                cchar = self.COMBINED_KEYS[ord(char)]
-                self._write(cchar >> 8, cchar & self.ALTGR_FLAG)
-                # second key (removing the altgr bit)
-                char = chr(cchar & 0xFF & (~self.ALTGR_FLAG))
-                keycode = self._char_to_keycode(char)
-                # assume no altgr needed for second key
-                self._write(keycode, False)
-            else:
-                raise ValueError(
-                    "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
-                        letter=repr(char), num=ord(char)
-                    )
-                )
+        continued = False
+        for reports in self._chunks(string):
+            self.keyboard.send_reports(reports, delay, continued=continued)
+            continued = True
+
+    async def write_async(self, string: str, delay: float = None) -> None:
+        """Type the string like `write()`, but yield to the asyncio event loop between
+        reports instead of blocking, so other tasks keep running while the text is typed.
+        Requires the ``asyncio`` library.
+
+        :param string: A string of UTF-8 characters to convert to key presses and send.
+        :param float delay: Optional delay in seconds between key presses.
+        :raises ValueError: if any of the characters has no keycode
+            (such as some control characters).
+
+        Example::
 
-            if delay is not None:
-                sleep(delay)
+            # Type a long text while other tasks keep running
+            await layout.write_async(text, 0.02)
+        """
+        continued = False
+        for reports in self._chunks(string):
+            await self.keyboard.send_reports_async(reports, delay, continued=continued)
+            continued = True
 
     def keycodes(self, char: str) -> Tuple[int, ...]:
         """Return a tuple of keycodes needed to type the given character.
@@ -146,46 +513,14 @@ class KeyboardLayoutBase:
             # Raises ValueError with a US layout because it's an unknown character
             keycode('é')
         """
-        keycode = self._char_to_keycode(char)
-        if keycode == 0:
+        if self.KEYCODE_TABLE:
+            combinations = self._table_combinations(ord(char))
+        else:
+            combinations = self._char_index().get(ord(char))
+        if combinations is None or len(combinations) != 1:
             raise ValueError(
                 "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
                     letter=repr(char), num=ord(char)
                 )
             )
-
-        codes = []
-        if char in self.NEED_ALTGR:
-            codes.append(self.RIGHT_ALT_CODE)
-        if keycode & self.SHIFT_FLAG:
-            codes.extend((self.SHIFT_CODE, keycode & ~self.SHIFT_FLAG))
-        else:
-            codes.append(keycode)
-
-        return codes
-
-    def _above128char_to_keycode(self, char: str) -> int:
-        """Return keycode for above 128 utf8 codes.
-
-        A character can be indexed by the char itself or its int ord() value.
-
-        :param char_val: char value
-        :return: keycode, with modifiers if needed
-        """
-        if ord(char) in self.HIGHER_ASCII:
-            return self.HIGHER_ASCII[ord(char)]
-        if char in self.HIGHER_ASCII:
-            return self.HIGHER_ASCII[char]
-        return 0
-
-    def _char_to_keycode(self, char: str) -> int:
-        """Return the HID keycode for the given character, with the SHIFT_FLAG possibly set.
-
-        If the character requires pressing the Shift key, the SHIFT_FLAG bit is set.
-        You must clear this bit before passing the keycode in a USB report.
-        """
-        char_val = ord(char)
-        if char_val > len(self.ASCII_TO_KEYCODE):
-            return self._above128char_to_keycode(char)
-        keycode = self.ASCII_TO_KEYCODE[char_val]
-        return keycode
+        return combinations[0]
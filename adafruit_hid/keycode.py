@@ -9,6 +9,32 @@
 * Author(s): Scott Shawcroft, Dan Halbert
 """
 
+KEYCODE_MODIFIER = 0x01
+"""`KEYCODE_FLAGS` bit set for the modifier keycodes, ``LEFT_CONTROL`` to ``RIGHT_GUI``."""
+KEYCODE_REGULAR = 0x02
+"""`KEYCODE_FLAGS` bit set for the regular keycodes that fit in a keyboard report,
+``A`` (0x04) to 0xDD."""
+KEYCODE_BEYOND_6KRO = 0x04
+"""`KEYCODE_FLAGS` bit set for the reserved keycodes above 0xDD that are not modifiers,
+which are outside the range of the standard 6-key keyboard report."""
+
+# The tables are built from repeated literals rather than generators,
+# so that importing this module runs no loop.
+MODIFIER_BITS = b"\x00" * 0xE0 + b"\x01\x02\x04\x08\x10\x20\x40\x80" + b"\x00" * 0x18
+"""256-byte table of the modifier bit for each keycode: the bit to set in the modifier
+byte of a keyboard report for a modifier key, 0 for any other key."""
+
+KEYCODE_FLAGS = (
+    b"\x00" * 0x04  # 0x00 to 0x03: not keys
+    + b"\x02" * (0xDE - 0x04)  # KEYCODE_REGULAR
+    + b"\x04" * (0xE0 - 0xDE)  # KEYCODE_BEYOND_6KRO
+    + b"\x01" * (0xE8 - 0xE0)  # KEYCODE_MODIFIER
+    + b"\x04" * (0x100 - 0xE8)  # KEYCODE_BEYOND_6KRO
+)
+"""256-byte table of the category flags of each keycode:
+`KEYCODE_MODIFIER`, `KEYCODE_REGULAR` or `KEYCODE_BEYOND_6KRO`.
+Keycodes 0x00 to 0x03 are not keys, and have no flag set."""
+
 
 class Keycode:
     """USB HID Keycode constants.
@@ -302,6 +328,4 @@ class Keycode:
     def modifier_bit(cls, keycode: int) -> int:
         """Return the modifer bit to be set in an HID keycode report if this is a
         modifier key; otherwise return 0."""
-        return (
-            1 << (keycode - 0xE0) if cls.LEFT_CONTROL <= keycode <= cls.RIGHT_GUI else 0
-        )
+        return MODIFIER_BITS[keycode] if 0 <= keycode <= 0xFF else 0
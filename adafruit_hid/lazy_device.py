@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.lazy_device.LazyDevice`
+====================================================
+"""
+
+from . import find_device, usb_connected
+from .report_queue import ReportQueue
+
+try:
+    from typing import Callable, Optional, Sequence
+except ImportError:
+    pass
+
+
+class LazyDevice:  # pylint: disable=too-many-instance-attributes
+    """Stand in for a HID device that may not be ready yet, so that `Keyboard`, `Mouse`,
+    `ConsumerControl` and the other HID objects can be created without waiting for USB.
+
+    The device is looked up at once, but reports sent before USB is connected are kept
+    in a `ReportQueue`, created when the first report has to wait, and sent as soon as
+    USB is found connected: on the next report, or when `poll()` or `wait_ready()` is
+    called. If more reports arrive than the queue holds, they are dropped following
+    ``policy``.
+
+    :param devices: a sequence of devices, or a device, as given to the HID objects.
+    :param int usage_page: usage page of the device to find.
+    :param int usage: usage of the device to find.
+    :param int report_length: length in bytes of the reports sent to the device. Defaults
+      to the first of the ``in_report_lengths`` of the device when it declares them.
+      CircuitPython devices do not, so give it for a device whose report length the HID
+      object must know, such as the 16-bit mouse of `adafruit_hid.mouse.create_device()`.
+    :param int size: number of reports kept until USB is connected, or 0 to drop them.
+    :param int policy: `ReportQueue.DROP_OLDEST` to keep the newest reports, or
+      `ReportQueue.COALESCE` to replace the newest queued report, for devices such as
+      gamepads whose reports give the complete state.
+    :param on_ready: function called with no arguments once USB is connected and the
+      queued reports are sent.
+
+    Example::
+
+        import usb_hid
+        from adafruit_hid.keyboard import Keyboard
+        from adafruit_hid.lazy_device import LazyDevice
+
+        kbd = Keyboard(LazyDevice(usb_hid.devices, usage_page=0x01, usage=0x06))
+        # ... initialize the display, sensors and network without waiting for USB.
+        kbd.send(Keycode.A)  # queued until USB is connected
+    """
+
+    def __init__(
+        self,
+        devices: Sequence[object],
+        *,
+        usage_page: int,
+        usage: int,
+        report_length: Optional[int] = None,
+        size: int = 8,
+        policy: int = ReportQueue.DROP_OLDEST,
+        on_ready: Optional[Callable[[], None]] = None
+    ) -> None:
+        if policy == ReportQueue.BLOCK:
+            raise ValueError("LazyDevice cannot block until USB is connected")
+        self._device = find_device(
+            devices, usage_page=usage_page, usage=usage, wait=False
+        )
+        self.usage_page = usage_page
+        """The usage page of the device."""
+        self.usage = usage
+        """The usage of the device."""
+        if hasattr(self._device, "in_report_lengths"):
+            self.in_report_lengths = self._device.in_report_lengths
+            if report_length is None:
+                report_length = self.in_report_lengths[0]
+        elif report_length is not None:
+            self.in_report_lengths = (report_length,)
+        self._report_length = report_length
+        self._size = size
+        self._policy = policy
+        self._queue = None
+        self._ready = False
+        self.on_ready = on_ready
+        """Function called with no arguments once USB is connected, or ``None``."""
+        self.dropped = 0
+        """Number of reports dropped while waiting for USB."""
+
+    @property
+    def ready(self) -> bool:
+        """``True`` once USB is connected and the queued reports are sent. Checking it
+        sends the queued reports and calls ``on_ready`` if USB just became connected."""
+        if not self._ready and usb_connected():
+            if self._queue is not None:
+                try:
+                    self._queue.flush()
+                except OSError:
+                    # Connected but not enumerated yet: the reports not sent stay
+                    # queued, in order, until the next check.
+                    return False
+                self.dropped += self._queue.dropped
+                self._queue = None
+            self._ready = True
+            if self.on_ready is not None:
+                self.on_ready()
+        return self._ready
+
+    def poll(self) -> bool:
+        """Check whether USB is connected, sending the queued reports if it just became
+        connected. Call this in the main loop if reports may stay queued for long.
+
+        :returns: `ready`.
+        """
+        return self.ready
+
+    async def wait_ready(self, interval: float = 0.01) -> None:
+        """Wait, without blocking other tasks, until USB is connected and the queued
+        reports are sent. Requires the ``asyncio`` library.
+
+        :param float interval: time in seconds between checks.
+
+        Example::
+
+            await keyboard_device.wait_ready()
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        while not self.ready:
+            await asyncio.sleep(interval)
+
+    def send_report(self, report: bytes) -> None:
+        """Send the report if USB is connected, or queue it until it is."""
+        if self.ready:
+            self._device.send_report(report)
+            return
+        if not self._size:
+            self.dropped += 1
+            return
+        if self._queue is None:
+            self._queue = ReportQueue(
+                self._device,
+                self._report_length or len(report),
+                size=self._size,
+                policy=self._policy,
+            )
+        self._queue.send_report(report)
+
+    def get_last_received_report(self) -> Optional[bytes]:
+        """Return the last report received from the host by the device,
+        such as the keyboard LED status."""
+        return self._device.get_last_received_report()
@@ -0,0 +1,449 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.macro.Macro`
+====================================================
+
+Automation macros mixing typed text, key chords, consumer control codes, mouse actions
+and delays, compiled once into a compact bytecode of prebuilt keyboard reports and
+timing operations.
+
+Macro source is text to type, with commands between braces:
+
+* ``{CTRL+ALT+T}``: press the keys together, then release them. Keys are `Keycode`
+  names, in any case, plus the short forms ``CTRL``, ``ESC``, ``DEL``, ``CMD`` and ``WIN``.
+* ``{PRESS SHIFT}``, ``{RELEASE SHIFT}``: hold keys down, or release them. ``{RELEASE}``
+  alone releases all the keys held.
+* ``{WAIT 300}``: wait 300 milliseconds, also written ``{WAIT 300ms}`` or ``{WAIT 0.3s}``.
+* ``{CC MUTE}``: send a `ConsumerControlCode`.
+* ``{MOUSE CLICK LEFT}``, ``{MOUSE PRESS LEFT+RIGHT}``, ``{MOUSE RELEASE LEFT}``:
+  mouse buttons ``LEFT``, ``RIGHT``, ``MIDDLE``, ``BACK`` and ``FORWARD``.
+* ``{MOUSE MOVE 100 -50}``, ``{MOUSE SCROLL -3}``: move the mouse, turn the wheel.
+* ``{{``: a literal ``{``.
+
+Example::
+
+    from adafruit_hid.macro import Macro
+
+    terminal = Macro.compile("{CTRL+ALT+T}{WAIT 300}ls -l\\n", layout)
+    terminal.run(keyboard=kbd)
+"""
+
+import time
+
+from micropython import const
+
+from .code_names import CONSUMER_CONTROL_CODE_NAMES, KEYCODE_NAMES
+from .keyboard_layout_base import ReportCache
+from .keycode import KEYCODE_FLAGS, KEYCODE_MODIFIER, MODIFIER_BITS
+from .mouse import Mouse
+
+try:
+    from typing import Optional
+    from .consumer_control import ConsumerControl
+    from .keyboard import Keyboard
+    from .keyboard_layout_base import KeyboardLayoutBase
+except ImportError:
+    pass
+
+# Opcodes, each followed by its operands, little endian.
+_KEYS = const(0x01)  # u8 count, then count 8-byte keyboard reports
+_WAIT = const(0x02)  # u16 milliseconds
+_CONSUMER = const(0x03)  # u16 consumer control code
+_MOUSE_PRESS = const(0x04)  # u8 buttons
+_MOUSE_RELEASE = const(0x05)  # u8 buttons
+_MOUSE_MOVE = const(0x06)  # i16 x, i16 y, i8 wheel
+
+# Devices needed by a macro.
+_NEEDS_KEYBOARD = const(0x01)
+_NEEDS_MOUSE = const(0x02)
+_NEEDS_CONSUMER_CONTROL = const(0x04)
+
+_HEADER = b"HIDM\x01"
+
+_KEY_ALIASES = {
+    "CTRL": "CONTROL",
+    "ESC": "ESCAPE",
+    "DEL": "DELETE",
+    "CMD": "COMMAND",
+    "WIN": "WINDOWS",
+}
+
+_MOUSE_BUTTONS = {
+    "LEFT": Mouse.LEFT_BUTTON,
+    "RIGHT": Mouse.RIGHT_BUTTON,
+    "MIDDLE": Mouse.MIDDLE_BUTTON,
+    "BACK": Mouse.BACK_BUTTON,
+    "FORWARD": Mouse.FORWARD_BUTTON,
+}
+
+
+class _Compiler:
+    """Turn macro source into bytecode, tracking the keys held down."""
+
+    def __init__(self, layout: Optional[KeyboardLayoutBase]) -> None:
+        self.layout = layout
+        self.code = bytearray()
+        self.modifiers = 0
+        self.keys = []
+        # Offset in code of the count of the last _KEYS operation, if it is the
+        # last operation, so that consecutive keyboard reports are merged into it.
+        self._keys_op = None
+
+    def reports(self, reports: bytes) -> None:
+        """Add keyboard reports, merging them into the previous ones if possible."""
+        start = 0
+        while start < len(reports):
+            if self._keys_op is None or self.code[self._keys_op] == 255:
+                self.code.append(_KEYS)
+                self._keys_op = len(self.code)
+                self.code.append(0)
+            self.code[self._keys_op] += 1
+            end = start + 8
+            while start < end:
+                self.code.append(reports[start])
+                start += 1
+
+    def operation(self, opcode: int, operands: bytes = b"") -> None:
+        """Add an operation other than keyboard reports."""
+        self.code.append(opcode)
+        self.code.extend(operands)
+        self._keys_op = None
+
+    @staticmethod
+    def held_report(modifiers: int, keys: list) -> bytes:
+        """Return the keyboard report with the given keys down."""
+        if len(keys) > 6:
+            raise ValueError("At most 6 regular keys can be down together")
+        report = bytearray(8)
+        report[0] = modifiers
+        report[2 : 2 + len(keys)] = bytes(keys)
+        return report
+
+    @staticmethod
+    def check_arguments(
+        command: str, arguments: list, count: int, exact: bool = True
+    ) -> None:
+        """Raise ValueError unless the command has ``count`` arguments, or at least
+        ``count`` when not ``exact``."""
+        if len(arguments) != count if exact else len(arguments) < count:
+            raise ValueError(
+                "{} needs {}{} argument{}".format(
+                    command,
+                    "" if exact else "at least ",
+                    count,
+                    "" if count == 1 else "s",
+                )
+            )
+
+    def text(self, text: str) -> None:
+        """Type text with the layout."""
+        if self.layout is None:
+            raise ValueError("Typing text needs a keyboard layout")
+        if self.modifiers or self.keys:
+            raise ValueError("Release the keys held before typing text")
+        self.reports(self.layout.compile(text))
+
+    def key_command(self, command: str, argument: str) -> None:
+        """Compile a chord, PRESS or RELEASE."""
+        modifiers = 0
+        keys = []
+        for name in argument.split("+") if argument else ():
+            name = name.strip().upper()
+            keycode = KEYCODE_NAMES.code(_KEY_ALIASES.get(name, name))
+            if KEYCODE_FLAGS[keycode] & KEYCODE_MODIFIER:
+                modifiers |= MODIFIER_BITS[keycode]
+            elif keycode not in keys:
+                keys.append(keycode)
+        if command == "RELEASE":
+            if argument:
+                self.modifiers &= ~modifiers
+                self.keys = [key for key in self.keys if key not in keys]
+            else:
+                self.modifiers = 0
+                self.keys = []
+            self.reports(self.held_report(self.modifiers, self.keys))
+            return
+        held = self.keys + [key for key in keys if key not in self.keys]
+        self.reports(self.held_report(self.modifiers | modifiers, held))
+        if command == "PRESS":
+            self.modifiers |= modifiers
+            self.keys = held
+        else:
+            self.reports(self.held_report(self.modifiers, self.keys))
+
+    def command(self, source: str) -> None:
+        """Compile the command between braces."""
+        words = source.split()
+        if not words:
+            raise ValueError("Empty macro command")
+        command = words[0].upper()
+        if command == "WAIT":
+            self.check_arguments(command, words[1:], 1)
+            duration = words[1].lower()
+            if duration.endswith("ms"):
+                milliseconds = int(duration[:-2])
+            elif duration.endswith("s"):
+                milliseconds = round(float(duration[:-1]) * 1000)
+            else:
+                milliseconds = int(duration)
+            while milliseconds > 0:
+                step = min(milliseconds, 0xFFFF)
+                self.operation(_WAIT, step.to_bytes(2, "little"))
+                milliseconds -= step
+        elif command == "CC":
+            self.check_arguments(command, words[1:], 1)
+            code = CONSUMER_CONTROL_CODE_NAMES.code(words[1])
+            self.operation(_CONSUMER, code.to_bytes(2, "little"))
+        elif command == "MOUSE":
+            self.check_arguments(command, words[1:], 1, exact=False)
+            self.mouse_command(words[1].upper(), words[2:])
+        elif command in ("PRESS", "RELEASE"):
+            self.key_command(command, "".join(words[1:]))
+        else:
+            self.key_command("CHORD", "".join(words))
+
+    def mouse_command(self, action: str, arguments: list) -> None:
+        """Compile a MOUSE command."""
+        command = "MOUSE " + action
+        if action in ("CLICK", "PRESS", "RELEASE"):
+            self.check_arguments(command, arguments, 1, exact=False)
+            buttons = 0
+            for name in "".join(arguments).upper().split("+"):
+                if name not in _MOUSE_BUTTONS:
+                    raise ValueError("Unknown mouse button: {}".format(name))
+                buttons |= _MOUSE_BUTTONS[name]
+            if action != "RELEASE":
+                self.operation(_MOUSE_PRESS, bytes((buttons,)))
+            if action != "PRESS":
+                self.operation(_MOUSE_RELEASE, bytes((buttons,)))
+        elif action in ("MOVE", "SCROLL"):
+            self.check_arguments(command, arguments, 2 if action == "MOVE" else 1)
+            if action == "MOVE":
+                x, y, wheel = int(arguments[0]), int(arguments[1]), 0
+            else:
+                x, y, wheel = 0, 0, int(arguments[0])
+            # Longer moves are split into several operations.
+            while True:
+                step_x = min(32767, max(-32767, x))
+                step_y = min(32767, max(-32767, y))
+                step_wheel = min(127, max(-127, wheel))
+                self.operation(
+                    _MOUSE_MOVE,
+                    (step_x & 0xFFFF).to_bytes(2, "little")
+                    + (step_y & 0xFFFF).to_bytes(2, "little")
+                    + bytes((step_wheel & 0xFF,)),
+                )
+                x -= step_x
+                y -= step_y
+                wheel -= step_wheel
+                if not (x or y or wheel):
+                    break
+        else:
+            raise ValueError("Unknown mouse action: {}".format(action))
+
+    def compile(self, source: str) -> bytes:
+        """Compile the whole source."""
+        text_start = 0
+        index = 0
+        while index < len(source):
+            if source[index] != "{":
+                index += 1
+                continue
+            if source.startswith("{{", index):
+                if text_start < index + 1:
+                    self.text(source[text_start : index + 1])
+                index += 2
+                text_start = index
+                continue
+            if text_start < index:
+                self.text(source[text_start:index])
+            end = source.find("}", index)
+            if end < 0:
+                raise ValueError("Missing } in macro")
+            self.command(source[index + 1 : end])
+            index = text_start = end + 1
+        if text_start < len(source):
+            self.text(source[text_start:])
+        if self.modifiers or self.keys:
+            self.key_command("RELEASE", "")
+        return bytes(self.code)
+
+
+def _signed(value: int, bits: int) -> int:
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+
+class Macro:
+    """A compiled macro, ready to run.
+
+    Macros are made with `compile()`, or loaded with `from_bytes()` from bytes saved by
+    `to_bytes()`. The bytecode is decoded once, when the Macro is created, so that
+    `run()` is a loop over prebuilt operations, without allocating memory or looking
+    anything up, apart from what the device methods do.
+
+    :param bytecode: the compiled macro, as `bytecode`.
+    """
+
+    cache = ReportCache(2048)
+    """`ReportCache` of the bytecode of the macros compiled, by source and layout,
+    shared by all the macros."""
+
+    def __init__(self, bytecode: bytes) -> None:
+        self.bytecode = bytes(bytecode)
+        """The compiled macro."""
+        code = memoryview(self.bytecode)
+        ops = bytearray()
+        args = []
+        needs = 0
+        index = 0
+        while index < len(code):
+            opcode = code[index]
+            if opcode == _KEYS:
+                end = index + 2 + 8 * code[index + 1]
+                arg = code[index + 2 : end]
+                needs |= _NEEDS_KEYBOARD
+            elif opcode in (_WAIT, _CONSUMER):
+                end = index + 3
+                arg = code[index + 1] | code[index + 2] << 8
+                if opcode == _WAIT:
+                    arg /= 1000
+                else:
+                    needs |= _NEEDS_CONSUMER_CONTROL
+            elif opcode in (_MOUSE_PRESS, _MOUSE_RELEASE):
+                end = index + 2
+                arg = code[index + 1]
+                needs |= _NEEDS_MOUSE
+            elif opcode == _MOUSE_MOVE:
+                end = index + 6
+                arg = (
+                    _signed(code[index + 1] | code[index + 2] << 8, 16),
+                    _signed(code[index + 3] | code[index + 4] << 8, 16),
+                    _signed(code[index + 5], 8),
+                )
+                needs |= _NEEDS_MOUSE
+            else:
+                raise ValueError("Invalid macro opcode: {}".format(opcode))
+            if end > len(code):
+                raise ValueError("Truncated macro")
+            ops.append(opcode)
+            args.append(arg)
+            index = end
+        self._ops = bytes(ops)
+        self._args = tuple(args)
+        self._needs = needs
+
+    @classmethod
+    def compile(
+        cls, source: str, layout: Optional[KeyboardLayoutBase] = None
+    ) -> "Macro":
+        """Compile macro source. The bytecode is kept in `cache`, so compiling the same
+        source again with the same layout is a simple lookup.
+
+        :param source: the macro source, see the module documentation.
+        :param layout: the keyboard layout used to type the text of the macro,
+          with its current ``typing_mode``. Only needed if the macro types text.
+        :raises ValueError: if the source is invalid.
+        """
+        key = (
+            source,
+            layout.__class__ if layout is not None else None,
+            getattr(layout, "typing_mode", None),
+        )
+        bytecode = cls.cache.get(key)
+        if bytecode is None:
+            bytecode = _Compiler(layout).compile(source)
+            cls.cache.put(key, bytecode)
+        return cls(bytecode)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Macro":
+        """Load a macro saved by `to_bytes()`.
+
+        :raises ValueError: if the data is not a saved macro.
+        """
+        if bytes(data[: len(_HEADER)]) != _HEADER:
+            raise ValueError("Not a compiled macro")
+        return cls(data[len(_HEADER) :])
+
+    def to_bytes(self) -> bytes:
+        """Return the macro as bytes, to save in a file and load with `from_bytes()`.
+        They do not depend on the layout any more."""
+        return _HEADER + self.bytecode
+
+    def _check_devices(
+        self,
+        keyboard: Optional[Keyboard],
+        mouse: Optional[Mouse],
+        consumer_control: Optional[ConsumerControl],
+    ) -> None:
+        if self._needs & _NEEDS_KEYBOARD and keyboard is None:
+            raise ValueError("This macro needs a keyboard")
+        if self._needs & _NEEDS_MOUSE and mouse is None:
+            raise ValueError("This macro needs a mouse")
+        if self._needs & _NEEDS_CONSUMER_CONTROL and consumer_control is None:
+            raise ValueError("This macro needs a consumer control")
+
+    def run(
+        self,
+        keyboard: Optional[Keyboard] = None,
+        mouse: Optional[Mouse] = None,
+        consumer_control: Optional[ConsumerControl] = None,
+    ) -> None:
+        """Run the macro, sending its reports to the given devices.
+
+        :raises ValueError: if the macro needs a device that is not given.
+        """
+        self._check_devices(keyboard, mouse, consumer_control)
+        ops = self._ops
+        args = self._args
+        i = 0
+        while i < len(ops):
+            opcode = ops[i]
+            if opcode == _KEYS:
+                keyboard.send_reports(args[i])
+            elif opcode == _WAIT:
+                time.sleep(args[i])
+            elif opcode == _CONSUMER:
+                consumer_control.send(args[i])
+            elif opcode == _MOUSE_PRESS:
+                mouse.press(args[i])
+            elif opcode == _MOUSE_RELEASE:
+                mouse.release(args[i])
+            else:
+                x, y, wheel = args[i]
+                mouse.move(x, y, wheel)
+            i += 1
+
+    async def run_async(
+        self,
+        keyboard: Optional[Keyboard] = None,
+        mouse: Optional[Mouse] = None,
+        consumer_control: Optional[ConsumerControl] = None,
+    ) -> None:
+        """Like `run()`, but wait without blocking other tasks.
+        Requires the ``asyncio`` library."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self._check_devices(keyboard, mouse, consumer_control)
+        ops = self._ops
+        args = self._args
+        i = 0
+        while i < len(ops):
+            opcode = ops[i]
+            if opcode == _KEYS:
+                await keyboard.send_reports_async(args[i])
+            elif opcode == _WAIT:
+                await asyncio.sleep(args[i])
+            elif opcode == _CONSUMER:
+                consumer_control.send(args[i])
+            elif opcode == _MOUSE_PRESS:
+                mouse.press(args[i])
+            elif opcode == _MOUSE_RELEASE:
+                mouse.release(args[i])
+            else:
+                x, y, wheel = args[i]
+                mouse.move(x, y, wheel)
+            i += 1
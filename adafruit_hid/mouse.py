@@ -8,14 +8,107 @@
 
 * Author(s): Dan Halbert
 """
-from . import find_device
+import time
+
+from . import (
+    Device,
+    _deduplicated,
+    _suppressed_reports_property,
+    _ticks_add,
+    _ticks_diff,
+    _ticks_ms,
+    find_device,
+)
 
 try:
     from typing import Sequence
     import usb_hid
+    from .mouse_trajectory import Trajectory
 except ImportError:
     pass
 
+_REPORT_DESCRIPTOR = (
+    b"\x05\x01"  # Usage Page (Generic Desktop)
+    b"\x09\x02"  # Usage (Mouse)
+    b"\xa1\x01"  # Collection (Application)
+    b"\x85\x02"  #   Report ID (set by report_descriptor())
+    b"\x09\x01"  #   Usage (Pointer)
+    b"\xa1\x00"  #   Collection (Physical)
+    b"\x05\x09"  #     Usage Page (Button)
+    b"\x19\x01"  #     Usage Minimum (Button 1)
+    b"\x29\x05"  #     Usage Maximum (Button 5)
+    b"\x15\x00"  #     Logical Minimum (0)
+    b"\x25\x01"  #     Logical Maximum (1)
+    b"\x95\x05"  #     Report Count (5)
+    b"\x75\x01"  #     Report Size (1)
+    b"\x81\x02"  #     Input (Data, Variable, Absolute)
+    b"\x95\x01"  #     Report Count (1)
+    b"\x75\x03"  #     Report Size (3)
+    b"\x81\x01"  #     Input (Constant)
+    b"\x05\x01"  #     Usage Page (Generic Desktop)
+    b"\x09\x30"  #     Usage (X)
+    b"\x09\x31"  #     Usage (Y)
+    b"\x16\x01\x80"  #     Logical Minimum (-32767)
+    b"\x26\xff\x7f"  #     Logical Maximum (32767)
+    b"\x75\x10"  #     Report Size (16)
+    b"\x95\x02"  #     Report Count (2)
+    b"\x81\x06"  #     Input (Data, Variable, Relative)
+    b"\x09\x38"  #     Usage (Wheel)
+    b"\x15\x81"  #     Logical Minimum (-127)
+    b"\x25\x7f"  #     Logical Maximum (127)
+    b"\x75\x08"  #     Report Size (8)
+    b"\x95\x01"  #     Report Count (1)
+    b"\x81\x06"  #     Input (Data, Variable, Relative)
+    b"\x05\x0c"  #     Usage Page (Consumer)
+    b"\x0a\x38\x02"  #     Usage (AC Pan)
+    b"\x95\x01"  #     Report Count (1)
+    b"\x81\x06"  #     Input (Data, Variable, Relative)
+    b"\xc0"  #   End Collection
+    b"\xc0"  # End Collection
+)
+
+
+def report_descriptor(report_id: int = 2) -> bytes:
+    """Return the HID report descriptor of a mouse with 16-bit reports: 5 buttons,
+    16-bit relative x and y, a wheel and a horizontal wheel (pan).
+
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+    """
+    descriptor = bytearray(_REPORT_DESCRIPTOR)
+    descriptor[7] = report_id
+    return bytes(descriptor)
+
+
+def create_device(report_id: int = 2) -> usb_hid.Device:
+    """Return a ``usb_hid.Device`` for a mouse with 16-bit reports, to enable in ``boot.py``
+    instead of ``usb_hid.Device.MOUSE``. `Mouse` then moves up to 32767 per report.
+
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+
+    Example::
+
+        # boot.py
+        import usb_hid
+        from adafruit_hid.mouse import create_device
+
+        usb_hid.enable((usb_hid.Device.KEYBOARD, create_device()))
+
+        # code.py
+        m = Mouse(usb_hid.devices, report_length=7)
+    """
+    import usb_hid  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    return usb_hid.Device(
+        report_descriptor=report_descriptor(report_id),
+        usage_page=0x01,
+        usage=0x02,
+        report_ids=(report_id,),
+        in_report_lengths=(7,),
+        out_report_lengths=(0,),
+    )
+
 
 class Mouse:
     """Send USB HID mouse reports."""
@@ -31,11 +124,28 @@ class Mouse:
     FORWARD_BUTTON = 16
     """Forward mouse button."""
 
-    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        report_length: int = None,
+        *,
+        deduplicate: bool = False,
+    ) -> None:
         """Create a Mouse object that will send USB mouse HID reports.
 
         :param timeout: Time in seconds to wait for USB to become ready before timing out.
           Defaults to None to wait indefinitely.
+        :param report_length: 4 for the standard mouse reports, with moves up to 127,
+          or 7 for the 16-bit mouse reports of `create_device()`, with moves up to 32767 and
+          a horizontal wheel (pan). Defaults to the first of the ``in_report_lengths``
+          of the device when it declares them, as on Blinka. A CircuitPython
+          ``usb_hid.Device`` does not declare them: it is sent an empty 7-byte report,
+          that does not move the mouse, and 4 is used if the device rejects it.
+          Other devices default to 4.
+        :param deduplicate: if ``True``, do not send reports identical to the last one sent,
+          such as `release_all()` with no buttons pressed. Reports that move the mouse
+          are always sent. See `suppressed_reports`.
 
         Devices can be a sequence of devices that includes a keyboard device or a keyboard device
         itself. A device is any object that implements ``send_report()``, ``usage_page`` and
@@ -45,12 +155,42 @@ class Mouse:
             devices, usage_page=0x1, usage=0x02, timeout=timeout
         )
 
+        if report_length is None:
+            report_length = self._detect_report_length(self._mouse_device)
+        if report_length not in (4, 7):
+            raise ValueError("Mouse report length must be 4 or 7")
+        self._mouse_device = _deduplicated(
+            self._mouse_device, deduplicate, relative_start=1
+        )
+
         # Reuse this bytearray to send mouse reports.
         # report[0] buttons pressed (LEFT, MIDDLE, RIGHT)
+        # With 4-byte reports:
         # report[1] x movement
         # report[2] y movement
         # report[3] wheel movement
-        self.report = bytearray(4)
+        # With 7-byte reports:
+        # report[1:3] x movement, little endian
+        # report[3:5] y movement, little endian
+        # report[5] wheel movement
+        # report[6] pan (horizontal wheel) movement
+        self.report = bytearray(report_length)
+        self._wide = report_length == 7
+        # Reports of a click, sent by click().
+        click_reports = memoryview(bytearray(2 * report_length))
+        self._press_report = click_reports[:report_length]
+        self._release_report = click_reports[report_length:]
+        self._max_move = 32767 if self._wide else 127
+
+        # Motion added by accumulate() and not sent yet, including fractions.
+        self._pending_x = 0.0
+        self._pending_y = 0.0
+        self._pending_wheel = 0.0
+        # Ticks at which accumulate() may send the next report.
+        self._next_motion_report = _ticks_ms()
+        self.coalesce_interval = 0.008
+        """Minimum time in seconds between the reports sent by `accumulate()`,
+        usually the host polling interval of the mouse. It is counted in whole milliseconds."""
 
     def press(self, buttons: int) -> None:
         """Press the given mouse buttons.
@@ -83,11 +223,16 @@ class Mouse:
         self.report[0] = 0
         self._send_no_move()
 
-    def click(self, buttons: int) -> None:
-        """Press and release the given mouse buttons.
+    def click(self, buttons: int, count: int = 1, interval: float = 0.02) -> None:
+        """Press and release the given mouse buttons, once or several times.
+
+        The press and release reports are built once in a preallocated buffer,
+        and sent back-to-back for each click.
 
         :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
             ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+        :param int count: number of clicks, such as 2 for a double-click.
+        :param float interval: time in seconds between clicks.
 
         Examples::
 
@@ -95,13 +240,47 @@ class Mouse:
             m.click(Mouse.LEFT_BUTTON)
 
             # Double-click the left button.
-            m.click(Mouse.LEFT_BUTTON)
-            m.click(Mouse.LEFT_BUTTON)
+            m.click(Mouse.LEFT_BUTTON, count=2)
+        """
+        self._press_report[0] = self.report[0] | buttons
+        self._release_report[0] = self.report[0] & ~buttons
+        for i in range(count):
+            if i:
+                time.sleep(interval)
+            self._mouse_device.send_report(self._press_report)
+            self._mouse_device.send_report(self._release_report)
+        self.report[0] &= ~buttons
+
+    def drag(self, buttons: int, x: int = 0, y: int = 0) -> None:
+        """Press the given mouse buttons, move, and release the buttons.
+
+        The buttons are pressed in the first motion report and released in the last one,
+        instead of separate reports, so a drag takes at least two reports and no more than
+        the move needs.
+
+        :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
+            ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+        :param x: Move the mouse along the x axis. Negative is to the left.
+        :param y: Move the mouse along the y axis. Negative is upwards on the display.
+
+        Example::
+
+            # Drag something 300 to the right.
+            m.drag(Mouse.LEFT_BUTTON, x=300)
         """
-        self.press(buttons)
-        self.release(buttons)
+        # At least two reports, so the host sees the buttons pressed.
+        steps = max(2, (max(abs(x), abs(y)) + self._max_move - 1) // self._max_move)
+        self.report[0] |= buttons
+        for step in range(steps, 0, -1):
+            partial_x = x // step
+            partial_y = y // step
+            if step == 1:
+                self.report[0] &= ~buttons
+            self._send_move(partial_x, partial_y, 0)
+            x -= partial_x
+            y -= partial_y
 
-    def move(self, x: int = 0, y: int = 0, wheel: int = 0) -> None:
+    def move(self, x: int = 0, y: int = 0, wheel: int = 0, pan: int = 0) -> None:
         """Move the mouse and turn the wheel as directed.
 
         :param x: Move the mouse along the x axis. Negative is to the left, positive
@@ -110,6 +289,7 @@ class Mouse:
             positive is downwards.
         :param wheel: Rotate the wheel this amount. Negative is toward the user, positive
             is away from the user. The scrolling effect depends on the host.
+        :param pan: Rotate the horizontal wheel this amount. Only available with 7-byte reports.
 
         Examples::
 
@@ -126,26 +306,178 @@ class Mouse:
             # Roll the mouse wheel away from the user.
             m.move(wheel=1)
         """
+        if pan and not self._wide:
+            raise ValueError("pan requires 7-byte mouse reports")
         # Send multiple reports if necessary to move or scroll requested amounts.
-        while x != 0 or y != 0 or wheel != 0:
-            partial_x = self._limit(x)
-            partial_y = self._limit(y)
-            partial_wheel = self._limit(wheel)
-            self.report[1] = partial_x & 0xFF
-            self.report[2] = partial_y & 0xFF
-            self.report[3] = partial_wheel & 0xFF
-            self._mouse_device.send_report(self.report)
-            x -= partial_x
-            y -= partial_y
-            wheel -= partial_wheel
+        step = 0
+        while self._send_move_step(x, y, wheel, pan, step):
+            step += 1
+
+    async def move_async(
+        self, x: int = 0, y: int = 0, wheel: int = 0, pan: int = 0
+    ) -> None:
+        """Move the mouse and turn the wheel like `move()`, but yield to the asyncio event
+        loop between reports instead of sending them all at once. Requires the ``asyncio``
+        library.
+
+        Example::
+
+            # Move 1000 to the right while other tasks keep running.
+            await m.move_async(x=1000)
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if pan and not self._wide:
+            raise ValueError("pan requires 7-byte mouse reports")
+        step = 0
+        while self._send_move_step(x, y, wheel, pan, step):
+            step += 1
+            await asyncio.sleep(0)
+
+    def accumulate(self, x: float = 0, y: float = 0, wheel: float = 0) -> bool:
+        """Add motion to be sent, and send it in a single report if the last one
+        was sent at least `coalesce_interval` ago.
+
+        Unlike `move()`, the amounts can be fractions: the fractional parts are kept
+        and added to the next calls, so that slow motion is not lost. This is meant to be
+        called as often as new sensor readings are available, such as from a trackball or an
+        IMU, without sending more reports than the host reads. Call `flush()` to send
+        the remaining motion when the sensor stops moving.
+
+        :param float x: Move the mouse along the x axis.
+        :param float y: Move the mouse along the y axis.
+        :param float wheel: Rotate the wheel this amount.
+        :returns: True if a report was sent.
+
+        Example::
+
+            while True:
+                dx, dy = sensor.motion
+                m.accumulate(dx * 0.3, dy * 0.3)
+        """
+        self._pending_x += x
+        self._pending_y += y
+        self._pending_wheel += wheel
+        wait = _ticks_diff(self._next_motion_report, _ticks_ms())
+        # A wait longer than the interval is stale, the ticks having wrapped around.
+        if 0 < wait <= round(self.coalesce_interval * 1000):
+            return False
+        return self.flush()
+
+    def flush(self) -> bool:
+        """Send the whole units of the motion added by `accumulate()` in one report,
+        keeping the fractions and whatever exceeds the report limits for the next one.
+
+        :returns: True if a report was sent.
+        """
+        x = self._limit(int(self._pending_x), self._max_move)
+        y = self._limit(int(self._pending_y), self._max_move)
+        wheel = self._limit(int(self._pending_wheel))
+        if not (x or y or wheel):
+            return False
+        self._send_move(x, y, wheel)
+        self._pending_x -= x
+        self._pending_y -= y
+        self._pending_wheel -= wheel
+        self._next_motion_report = _ticks_add(
+            _ticks_ms(), round(self.coalesce_interval * 1000)
+        )
+        return True
+
+    def follow(self, trajectory: Trajectory, rate: float = 125) -> None:
+        """Send the reports of a precomputed trajectory, at a steady rate.
+
+        Each report is sent at its deadline, counted from the start, so the pace does not
+        drift, and no memory is allocated per report.
+
+        :param trajectory: a `Trajectory` to follow.
+        :param float rate: the number of reports per second.
+
+        Example::
+
+            from adafruit_hid.mouse_trajectory import Trajectory
+
+            # Glide smoothly 2000 to the right in one second.
+            glide = Trajectory.eased(2000, 0, 125)
+            m.follow(glide, rate=125)
+        """
+        deltas = trajectory.deltas
+        start = _ticks_ms()
+        i = 0
+        while i < len(deltas):
+            if i:
+                # Deadline of this report: i / 2 reports were sent, at rate per second.
+                deadline = _ticks_add(start, int(i * 500 / rate))
+                wait = _ticks_diff(deadline, _ticks_ms())
+                if wait > 0:
+                    time.sleep(wait / 1000)
+            self._send_move(deltas[i], deltas[i + 1], 0)
+            i += 2
+
+    suppressed_reports = _suppressed_reports_property("_mouse_device")
+
+    @staticmethod
+    def _detect_report_length(device: object) -> int:
+        """Return the length of the reports taken by the device, 4 or 7."""
+        lengths = getattr(device, "in_report_lengths", None)
+        if lengths is not None:
+            return lengths[0]
+        if Device is not None and isinstance(device, Device):
+            # A usb_hid.Device rejects reports of another length than its own.
+            try:
+                device.send_report(bytes(7))
+            except ValueError:
+                return 4
+            return 7
+        return 4
+
+    def _send_move(self, x: int, y: int, wheel: int, pan: int = 0) -> None:
+        """Send a report moving by amounts within the report limits."""
+        report = self.report
+        if self._wide:
+            report[1] = x & 0xFF
+            report[2] = (x >> 8) & 0xFF
+            report[3] = y & 0xFF
+            report[4] = (y >> 8) & 0xFF
+            report[5] = wheel & 0xFF
+            report[6] = pan & 0xFF
+        else:
+            report[1] = x & 0xFF
+            report[2] = y & 0xFF
+            report[3] = wheel & 0xFF
+        self._mouse_device.send_report(report)
+
+    def _send_move_step(  # pylint: disable=too-many-arguments
+        self, x: int, y: int, wheel: int, pan: int, step: int
+    ) -> bool:
+        """Send report number ``step``, counting from 0, of a move split into reports
+        within the report limits.
+
+        :returns: ``False``, without sending anything, if the move needs fewer reports.
+        """
+        partial_x = self._step_part(x, step, self._max_move)
+        partial_y = self._step_part(y, step, self._max_move)
+        partial_wheel = self._step_part(wheel, step)
+        partial_pan = self._step_part(pan, step)
+        if not (partial_x or partial_y or partial_wheel or partial_pan):
+            return False
+        self._send_move(partial_x, partial_y, partial_wheel, partial_pan)
+        return True
+
+    @staticmethod
+    def _step_part(dist: int, step: int, limit: int = 127) -> int:
+        """Return the part of ``dist`` moved by report number ``step``, when each
+        report moves up to ``limit``."""
+        if dist >= 0:
+            return min(limit, max(0, dist - step * limit))
+        return max(-limit, min(0, dist + step * limit))
 
     def _send_no_move(self) -> None:
         """Send a button-only report."""
-        self.report[1] = 0
-        self.report[2] = 0
-        self.report[3] = 0
+        for i in range(1, len(self.report)):
+            self.report[i] = 0
         self._mouse_device.send_report(self.report)
 
     @staticmethod
-    def _limit(dist: int) -> int:
-        return min(127, max(-127, dist))
+    def _limit(dist: int, limit: int = 127) -> int:
+        return min(limit, max(-limit, dist))
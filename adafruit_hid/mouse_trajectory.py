@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.mouse_trajectory.Trajectory`
+====================================================
+"""
+
+from array import array
+
+try:
+    from typing import Callable, Tuple
+except ImportError:
+    pass
+
+
+class Trajectory:
+    """A mouse path precomputed as the x and y moves of each report, to be sent with
+    `Mouse.follow()`.
+
+    Build one with `linear()`, `eased()` or `bezier()`. The whole path is computed
+    once, so following it sends a fixed number of reports without computing or
+    allocating anything per report.
+
+    :param deltas: ``array('b')`` of the x and y moves of each report, interleaved.
+    """
+
+    def __init__(self, deltas: array) -> None:
+        self.deltas = deltas
+        """``array('b')`` of the x and y moves of each report, interleaved."""
+
+    def __len__(self) -> int:
+        """Return the number of reports of the trajectory."""
+        return len(self.deltas) // 2
+
+    @classmethod
+    def from_path(
+        cls, path: Callable[[float], Tuple[float, float]], reports: int
+    ) -> "Trajectory":
+        """Build a trajectory sampling a path in ``reports`` steps.
+
+        :param path: a function returning the (x, y) position at a time from 0 to 1,
+          starting at (0, 0).
+        :param int reports: the number of reports to send.
+        :raises ValueError: if a step would move more than 127 on an axis.
+        """
+        if reports < 1:
+            raise ValueError("reports must be at least 1")
+        deltas = array("b", bytes(2 * reports))
+        last_x = last_y = 0
+        for step in range(reports):
+            x, y = path((step + 1) / reports)
+            # Round positions rather than moves, so rounding errors do not add up.
+            x = round(x)
+            y = round(y)
+            if not (-127 <= x - last_x <= 127 and -127 <= y - last_y <= 127):
+                raise ValueError("Too few reports for this trajectory")
+            deltas[2 * step] = x - last_x
+            deltas[2 * step + 1] = y - last_y
+            last_x = x
+            last_y = y
+        return cls(deltas)
+
+    @classmethod
+    def linear(cls, x: int, y: int, reports: int) -> "Trajectory":
+        """Move in a straight line at constant speed.
+
+        :param int x: distance to move along the x axis.
+        :param int y: distance to move along the y axis.
+        :param int reports: the number of reports to send.
+
+        Example::
+
+            # Glide 2000 to the right in 100 reports.
+            m.follow(Trajectory.linear(2000, 0, 100))
+        """
+        return cls.from_path(lambda progress: (x * progress, y * progress), reports)
+
+    @classmethod
+    def eased(cls, x: int, y: int, reports: int) -> "Trajectory":
+        """Move in a straight line, accelerating at the start and slowing down at the end.
+
+        :param int x: distance to move along the x axis.
+        :param int y: distance to move along the y axis.
+        :param int reports: the number of reports to send.
+        """
+
+        def path(progress):
+            progress = progress * progress * (3 - 2 * progress)
+            return (x * progress, y * progress)
+
+        return cls.from_path(path, reports)
+
+    @classmethod
+    def bezier(  # pylint: disable=too-many-arguments
+        cls,
+        x: int,
+        y: int,
+        control1: Tuple[int, int],
+        control2: Tuple[int, int],
+        reports: int,
+    ) -> "Trajectory":
+        """Move along a cubic Bezier curve.
+
+        :param int x: distance to move along the x axis.
+        :param int y: distance to move along the y axis.
+        :param control1: (x, y) first control point, relative to the start.
+        :param control2: (x, y) second control point, relative to the start.
+        :param int reports: the number of reports to send.
+
+        Example::
+
+            # Arc to (800, 0) through the top of the screen.
+            m.follow(Trajectory.bezier(800, 0, (200, -300), (600, -300), 60))
+        """
+
+        def path(progress):
+            rest = 1 - progress
+            # Bernstein weights of the control points and of the end point.
+            weight1 = 3 * rest * rest * progress
+            weight2 = 3 * rest * progress * progress
+            weight_end = progress * progress * progress
+            return (
+                weight1 * control1[0] + weight2 * control2[0] + weight_end * x,
+                weight1 * control1[1] + weight2 * control2[1] + weight_end * y,
+            )
+
+        return cls.from_path(path, reports)
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.nkro_keyboard.NKROKeyboard`
+====================================================
+"""
+
+from micropython import const
+
+from . import find_device
+from .keyboard import Keyboard
+from .keycode import KEYCODE_BEYOND_6KRO, KEYCODE_FLAGS, KEYCODE_MODIFIER, MODIFIER_BITS
+
+try:
+    from typing import Sequence
+    import usb_hid
+except ImportError:
+    pass
+
+_REPORT_LENGTH = const(29)
+# Keycodes 0x00 to 0xDF have a bit in the report.
+_BITMAP_KEYCODES = const(0xE0)
+
+_REPORT_DESCRIPTOR = (
+    b"\x05\x01"  # Usage Page (Generic Desktop)
+    b"\x09\x06"  # Usage (Keyboard)
+    b"\xa1\x01"  # Collection (Application)
+    b"\x85\x06"  #   Report ID (set by report_descriptor())
+    b"\x05\x07"  #   Usage Page (Keyboard)
+    b"\x19\xe0"  #   Usage Minimum (Left Control)
+    b"\x29\xe7"  #   Usage Maximum (Right GUI)
+    b"\x15\x00"  #   Logical Minimum (0)
+    b"\x25\x01"  #   Logical Maximum (1)
+    b"\x75\x01"  #   Report Size (1)
+    b"\x95\x08"  #   Report Count (8)
+    b"\x81\x02"  #   Input (Data, Variable, Absolute)
+    b"\x19\x00"  #   Usage Minimum (0)
+    b"\x29\xdf"  #   Usage Maximum (0xDF)
+    b"\x95\xe0"  #   Report Count (224)
+    b"\x81\x02"  #   Input (Data, Variable, Absolute)
+    b"\x05\x08"  #   Usage Page (LEDs)
+    b"\x19\x01"  #   Usage Minimum (Num Lock)
+    b"\x29\x05"  #   Usage Maximum (Kana)
+    b"\x95\x05"  #   Report Count (5)
+    b"\x91\x02"  #   Output (Data, Variable, Absolute)
+    b"\x95\x03"  #   Report Count (3)
+    b"\x91\x01"  #   Output (Constant)
+    b"\xc0"  # End Collection
+)
+
+
+def report_descriptor(report_id: int = 6) -> bytes:
+    """Return the HID report descriptor of an NKRO keyboard: a byte of modifiers followed
+    by one bit per keycode, and the same LED report as the standard keyboard.
+
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+    """
+    descriptor = bytearray(_REPORT_DESCRIPTOR)
+    descriptor[7] = report_id
+    return bytes(descriptor)
+
+
+def create_device(report_id: int = 6) -> usb_hid.Device:
+    """Return a ``usb_hid.Device`` for an NKRO keyboard, to enable in ``boot.py``
+    instead of ``usb_hid.Device.KEYBOARD``.
+
+    The NKRO keyboard is not a boot keyboard: it does not work in the BIOS of a computer.
+
+    :param int report_id: the report ID of the device, which must differ from the IDs
+      of the other devices enabled.
+
+    Example::
+
+        # boot.py
+        import usb_hid
+        from adafruit_hid.nkro_keyboard import create_device
+
+        usb_hid.enable((create_device(), usb_hid.Device.MOUSE))
+    """
+    import usb_hid  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    return usb_hid.Device(
+        report_descriptor=report_descriptor(report_id),
+        usage_page=0x01,
+        usage=0x06,
+        report_ids=(report_id,),
+        in_report_lengths=(_REPORT_LENGTH,),
+        out_report_lengths=(1,),
+    )
+
+
+class NKROKeyboard(Keyboard):
+    """Send HID keyboard reports with n-key rollover: any number of keys can be held
+    at once, and pressing or releasing a key sets or clears a single bit of the report.
+
+    The device must be enabled in ``boot.py``, see `create_device()`.
+    It is used like `Keyboard`, including with the keyboard layouts: the 8-byte boot
+    keyboard reports given to `send_reports()` are translated into NKRO reports.
+    """
+
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        *,
+        deduplicate: bool = False,
+    ) -> None:
+        """Create an NKROKeyboard object that will send NKRO keyboard HID reports.
+
+        :param timeout: Time in seconds to wait for USB to become ready before timing out.
+          Defaults to None to wait indefinitely.
+        :param deduplicate: if ``True``, do not send reports identical to the last one sent.
+
+        Devices can be a sequence of devices that includes an NKRO keyboard device or an
+        NKRO keyboard device itself. In a sequence, keyboard devices taking other reports,
+        such as ``usb_hid.Device.KEYBOARD``, are skipped. On CircuitPython, where devices
+        do not tell their report lengths, each keyboard device is sent an empty NKRO report,
+        releasing all the keys, until one accepts it.
+
+        :raises ValueError: if no device takes NKRO reports.
+        """
+        if not hasattr(devices, "send_report"):
+            devices = self._find_nkro_device(devices, timeout)
+        super().__init__(devices, timeout, deduplicate=deduplicate)
+
+        # report[0] modifiers
+        # report[1:29] one bit per keycode, from 0x00 (LSB of report[1]) to 0xDF
+        self.report = bytearray(_REPORT_LENGTH)
+        self.report_modifier = memoryview(self.report)[0:1]
+        self.report_keys = memoryview(self.report)[1:]
+
+    def _holds_key(self, keycode: int) -> bool:
+        """Return ``True`` if the regular key is pressed in the report."""
+        return bool(self.report_keys[keycode >> 3] & 1 << (keycode & 7))
+
+    def _release_keys_not_in(self, reports: bytes, start: int) -> bool:
+        """Clear the bits of the keys that the 8-byte boot keyboard report at offset
+        ``start`` of ``reports`` does not press, keeping the modifiers.
+
+        :returns: ``True`` if any key was released.
+        """
+        report_keys = self.report_keys
+        released = False
+        i = 0
+        while i < len(report_keys):
+            bit = 0
+            while report_keys[i] >> bit:
+                if report_keys[i] & 1 << bit:
+                    keycode = i << 3 | bit
+                    k = start + 2
+                    while k < start + 8 and reports[k] != keycode:
+                        k += 1
+                    if k == start + 8:
+                        report_keys[i] &= ~(1 << bit)
+                        released = True
+                bit += 1
+            i += 1
+        return released
+
+    def _load_boot_report(self, reports: bytes, start: int) -> None:
+        """Set the report to the keys of the 8-byte boot keyboard report at offset
+        ``start`` of ``reports``."""
+        report_keys = self.report_keys
+        i = 0
+        while i < len(report_keys):
+            report_keys[i] = 0
+            i += 1
+        self.report_modifier[0] = reports[start]
+        i = start + 2
+        while i < start + 8:
+            keycode = reports[i]
+            if keycode:
+                report_keys[keycode >> 3] |= 1 << (keycode & 7)
+            i += 1
+
+    @staticmethod
+    def _find_nkro_device(devices: Sequence[usb_hid.Device], timeout: int) -> object:
+        """Return the first keyboard device of the sequence taking NKRO reports."""
+        probe = None
+        for device in devices:
+            if not (
+                hasattr(device, "send_report")
+                and device.usage_page == 0x01
+                and device.usage == 0x06
+            ):
+                continue
+            lengths = getattr(device, "in_report_lengths", None)
+            if lengths is not None:
+                if _REPORT_LENGTH in lengths:
+                    return device
+                continue
+            # Wait for USB before sending anything.
+            find_device(device, usage_page=0x01, usage=0x06, timeout=timeout)
+            if probe is None:
+                probe = bytes(_REPORT_LENGTH)
+            try:
+                device.send_report(probe)
+            except ValueError:
+                # A device taking reports of another length.
+                continue
+            return device
+        raise ValueError("Could not find an NKRO keyboard device.")
+
+    @staticmethod
+    def _keycode_flags(keycode: int) -> int:
+        """Return the `KEYCODE_FLAGS` of a keycode, accepting like `Keyboard` the modifiers
+        and the regular keycodes, plus the `KEYCODE_BEYOND_6KRO` keycodes 0xDE and 0xDF,
+        which have a bit in the report.
+
+        :raises ValueError: if the keycode cannot be sent in the report.
+        """
+        if 0 <= keycode < _BITMAP_KEYCODES:
+            flags = KEYCODE_FLAGS[keycode]
+            if flags & KEYCODE_BEYOND_6KRO:
+                return flags
+        return Keyboard._keycode_flags(keycode)
+
+    def _add_keycode_to_report(self, keycode: int) -> None:
+        """Set the bit of a single keycode in the report."""
+        if self._keycode_flags(keycode) & KEYCODE_MODIFIER:
+            self.report_modifier[0] |= MODIFIER_BITS[keycode]
+        else:
+            self.report_keys[keycode >> 3] |= 1 << (keycode & 7)
+
+    def _remove_keycode_from_report(self, keycode: int) -> None:
+        """Clear the bit of a single keycode in the report."""
+        if self._keycode_flags(keycode) & KEYCODE_MODIFIER:
+            self.report_modifier[0] &= ~MODIFIER_BITS[keycode]
+        else:
+            self.report_keys[keycode >> 3] &= ~(1 << (keycode & 7))
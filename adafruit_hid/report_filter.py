@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.report_filter.ReportFilter`
+====================================================
+"""
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+
+class ReportFilter:
+    """Skip the reports that are byte-identical to the last report sent to a HID device,
+    such as a release when nothing is pressed, and count them.
+
+    A ReportFilter implements ``send_report()``, ``usage_page`` and ``usage``, so it can be
+    given to `Keyboard`, `Mouse` or `ConsumerControl` instead of the device itself.
+    They create one when given ``deduplicate=True``.
+    No memory is allocated once the first report has been sent.
+
+    :param device: the device to send the reports to.
+    :param relative_start: index of the first byte of the relative fields of the report,
+      such as the motion of a mouse. Reports with relative fields that are not all zero
+      are always sent, as repeating them is not a no-op. ``None`` if there are none.
+    """
+
+    def __init__(self, device: object, *, relative_start: Optional[int] = None) -> None:
+        self._device = device
+        self.usage_page = device.usage_page
+        """The usage page of the device."""
+        self.usage = device.usage
+        """The usage of the device."""
+        if hasattr(device, "in_report_lengths"):
+            self.in_report_lengths = device.in_report_lengths
+        self._relative_start = relative_start
+        self._last_report = None
+        self.suppressed_reports = 0
+        """Number of reports not sent because they were identical to the last one."""
+
+    def send_report(self, report: bytes) -> None:
+        """Send the report to the device, unless it is identical to the last report sent."""
+        last_report = self._last_report
+        if last_report is not None and len(last_report) == len(report):
+            i = 0
+            while i < len(report):
+                if report[i] != last_report[i]:
+                    break
+                i += 1
+            else:
+                if not self._is_relative(report):
+                    self.suppressed_reports += 1
+                    return
+            self._device.send_report(report)
+            last_report[:] = report
+        else:
+            self._device.send_report(report)
+            self._last_report = bytearray(report)
+
+    def _is_relative(self, report: bytes) -> bool:
+        """Return ``True`` if the relative fields of the report are not all zero."""
+        if self._relative_start is None:
+            return False
+        i = self._relative_start
+        while i < len(report):
+            if report[i]:
+                return True
+            i += 1
+        return False
+
+    def get_last_received_report(self) -> Optional[bytes]:
+        """Return the last report received from the host, as the device does."""
+        return self._device.get_last_received_report()
+
+    def reset(self) -> None:
+        """Forget the last report, so that the next one is sent even if identical,
+        for instance after the host was reconnected."""
+        self._last_report = None
@@ -0,0 +1,299 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.report_layout`
+====================================================
+
+Pack reports for any HID device from its report descriptor.
+
+The descriptor is parsed once by `ReportLayout` into `ReportField` objects that know
+the bit offset, size, signedness and logical range of each field, so that setting a
+field is a few integer operations on a preallocated report, without allocating memory.
+
+Example::
+
+    import usb_hid
+    from adafruit_hid import find_device
+    from adafruit_hid.gamepad import report_descriptor
+    from adafruit_hid.report_layout import ReportLayout
+
+    layout = ReportLayout(report_descriptor(buttons=24, axes=6))
+    x = layout.field(0x01, 0x30)
+    button_20 = layout.field(0x09, 20)
+    report = layout.create_report()
+    device = find_device(usb_hid.devices, usage_page=0x01, usage=0x05)
+
+    x.set(report, -100)
+    button_20.set(report, 1)
+    device.send_report(report)
+"""
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+# Item types and tags, from the Device Class Definition for HID 1.11, section 6.2.2.
+_MAIN = 0
+_GLOBAL = 1
+_LOCAL = 2
+
+_INPUT = 0x8
+_OUTPUT = 0x9
+_FEATURE = 0xB
+
+_USAGE_PAGE = 0x0
+_LOGICAL_MINIMUM = 0x1
+_LOGICAL_MAXIMUM = 0x2
+_REPORT_SIZE = 0x7
+_REPORT_ID = 0x8
+_REPORT_COUNT = 0x9
+_PUSH = 0xA
+_POP = 0xB
+
+_USAGE = 0x0
+_USAGE_MINIMUM = 0x1
+_USAGE_MAXIMUM = 0x2
+
+# Flags of the Input, Output and Feature items.
+_CONSTANT = 0x01
+_VARIABLE = 0x02
+_RELATIVE = 0x04
+
+
+class ReportField:
+    """One field of a report: a button, an axis, or a slot of an array such as the
+    keycodes of a keyboard. Returned by `ReportLayout.field()`.
+
+    On CircuitPython, fields wider than 30 bits allocate memory when set, as their values
+    do not fit in small integers."""
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+
+    def __init__(
+        self,
+        usage_page: int,
+        usage: int,
+        offset: int,
+        size: int,
+        minimum: int,
+        maximum: int,
+        flags: int,
+    ) -> None:
+        self.usage_page = usage_page
+        """Usage page of the field."""
+        self.usage = usage
+        """Usage of the field, or 0 for a slot of an array."""
+        self.offset = offset
+        """Offset of the field in the report, in bits."""
+        self.size = size
+        """Size of the field, in bits."""
+        self.minimum = minimum
+        """Logical minimum of the field."""
+        self.maximum = maximum
+        """Logical maximum of the field."""
+        self.signed = minimum < 0
+        """``True`` if the field holds negative values, in two's complement."""
+        self.relative = bool(flags & _RELATIVE)
+        """``True`` if the field is relative to the previous report, like a mouse move."""
+        self.variable = bool(flags & _VARIABLE)
+        """``False`` if the field is a slot of an array, holding a usage."""
+        self._byte = offset >> 3
+        self._shift = offset & 7
+        self._mask = (1 << size) - 1
+
+    def set(self, report: bytearray, value: int) -> None:
+        """Write a value into the field of the report, without allocating memory.
+
+        :param report: a report of the layout, from `ReportLayout.create_report()`.
+        :param value: the value, within the logical range of the field.
+        """
+        if not self.minimum <= value <= self.maximum:
+            raise ValueError(
+                "Value must be in range {} to {}".format(self.minimum, self.maximum)
+            )
+        value &= self._mask
+        index = self._byte
+        shift = self._shift
+        bits = self.size
+        while bits:
+            chunk = 8 - shift if bits > 8 - shift else bits
+            mask = ((1 << chunk) - 1) << shift
+            report[index] = report[index] & ~mask | (value << shift) & mask
+            value >>= chunk
+            bits -= chunk
+            shift = 0
+            index += 1
+
+    def get(self, report: bytearray) -> int:
+        """Read the value of the field from the report."""
+        value = 0
+        index = self._byte
+        shift = self._shift
+        done = 0
+        while done < self.size:
+            value |= (report[index] >> shift) << done
+            done += 8 - shift
+            shift = 0
+            index += 1
+        value &= self._mask
+        if self.signed and value >> (self.size - 1):
+            value -= 1 << self.size
+        return value
+
+
+def _item_value(descriptor: bytes, start: int, size: int, signed: bool) -> int:
+    """Return the little endian data of an item."""
+    value = 0
+    shift = 0
+    for index in range(start, start + size):
+        value |= descriptor[index] << shift
+        shift += 8
+    if signed and size and value >> (shift - 1):
+        value -= 1 << shift
+    return value
+
+
+class ReportLayout:
+    """The fields of one report of a HID report descriptor.
+
+    :param descriptor: the HID report descriptor, as given to ``usb_hid.Device``.
+    :param report_id: the ID of the report, or ``None`` for the first report of
+      the descriptor.
+    :param kind: ``"input"`` for reports sent to the host with ``send_report()``,
+      ``"output"`` for reports received from the host, such as keyboard LEDs,
+      or ``"feature"``.
+
+    Only the fields of the given report are kept. Constant fields, the padding,
+    are skipped. The report ID byte is not part of the report, as with
+    ``usb_hid.Device.send_report()``.
+    """
+
+    def __init__(
+        self, descriptor: bytes, report_id: Optional[int] = None, kind: str = "input"
+    ) -> None:
+        main_tag = {"input": _INPUT, "output": _OUTPUT, "feature": _FEATURE}[kind]
+        self.report_id = report_id
+        """The report ID of the layout, 0 if the descriptor has no report IDs."""
+        self.fields = []
+        """All the fields of the report, in the order of the descriptor."""
+        self.length = 0
+        """Length of the report in bytes, without the report ID."""
+        self._parse(descriptor, main_tag)
+
+    def _parse(self, descriptor: bytes, main_tag: int) -> None:
+        # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        globals_ = {_USAGE_PAGE: 0, _LOGICAL_MINIMUM: 0, _LOGICAL_MAXIMUM: 0}
+        globals_[_REPORT_SIZE] = globals_[_REPORT_COUNT] = globals_[_REPORT_ID] = 0
+        stack = []
+        usages = []
+        usage_minimum = usage_maximum = None
+        offsets = {}
+        index = 0
+        while index < len(descriptor):
+            prefix = descriptor[index]
+            if prefix == 0xFE:  # Long item, not used by HID 1.11.
+                index += 3 + descriptor[index + 1]
+                continue
+            size = (0, 1, 2, 4)[prefix & 0x03]
+            item_type = (prefix >> 2) & 0x03
+            tag = prefix >> 4
+            data = _item_value(descriptor, index + 1, size, False)
+            index += 1 + size
+
+            if item_type == _GLOBAL:
+                if tag == _LOGICAL_MINIMUM:
+                    data = _item_value(descriptor, index - size, size, True)
+                elif tag == _LOGICAL_MAXIMUM and globals_[_LOGICAL_MINIMUM] < 0:
+                    data = _item_value(descriptor, index - size, size, True)
+                if tag == _PUSH:
+                    stack.append(dict(globals_))
+                elif tag == _POP:
+                    globals_ = stack.pop()
+                else:
+                    globals_[tag] = data
+                if tag == _REPORT_ID and self.report_id is None:
+                    self.report_id = data
+            elif item_type == _LOCAL:
+                if size < 4:
+                    data |= globals_[_USAGE_PAGE] << 16
+                if tag == _USAGE:
+                    usages.append(data)
+                elif tag == _USAGE_MINIMUM:
+                    usage_minimum = data
+                elif tag == _USAGE_MAXIMUM:
+                    usage_maximum = data
+            elif item_type == _MAIN:
+                if tag in (_INPUT, _OUTPUT, _FEATURE):
+                    report_id = globals_[_REPORT_ID]
+                    key = (report_id, tag)
+                    offset = offsets.get(key, 0)
+                    bits = globals_[_REPORT_SIZE]
+                    count = globals_[_REPORT_COUNT]
+                    if tag == main_tag and report_id == (self.report_id or 0):
+                        if not data & _CONSTANT:
+                            self._add_fields(
+                                data,
+                                offset,
+                                globals_,
+                                usages,
+                                usage_minimum,
+                                usage_maximum,
+                            )
+                        self.length = (offset + bits * count + 7) >> 3
+                    offsets[key] = offset + bits * count
+                # Local items only apply to the next main item.
+                usages = []
+                usage_minimum = usage_maximum = None
+        if self.report_id is None:
+            self.report_id = 0
+
+    # pylint: disable=too-many-arguments
+    def _add_fields(
+        self, flags, offset, globals_, usages, usage_minimum, usage_maximum
+    ) -> None:
+        bits = globals_[_REPORT_SIZE]
+        for number in range(globals_[_REPORT_COUNT]):
+            if not flags & _VARIABLE:
+                usage = globals_[_USAGE_PAGE] << 16
+            elif number < len(usages):
+                usage = usages[number]
+            elif usage_minimum is not None:
+                usage = min(usage_minimum + number - len(usages), usage_maximum)
+            elif usages:
+                usage = usages[-1]
+            else:
+                usage = globals_[_USAGE_PAGE] << 16
+            self.fields.append(
+                ReportField(
+                    usage >> 16,
+                    usage & 0xFFFF,
+                    offset + number * bits,
+                    bits,
+                    globals_[_LOGICAL_MINIMUM],
+                    globals_[_LOGICAL_MAXIMUM],
+                    flags,
+                )
+            )
+
+    def field(self, usage_page: int, usage: int, index: int = 0) -> ReportField:
+        """Return the field with the given usage.
+
+        :param usage_page: usage page of the field, such as 0x01 (Generic Desktop)
+          or 0x09 (Button).
+        :param usage: usage of the field, such as 0x30 (X) or the button number.
+          Use 0 for the slots of an array, such as the keycodes of a keyboard.
+        :param index: which of the fields with the same usage to return, from 0.
+        """
+        for field in self.fields:
+            if field.usage_page == usage_page and field.usage == usage:
+                if not index:
+                    return field
+                index -= 1
+        raise ValueError("No such field in the report.")
+
+    def create_report(self) -> bytearray:
+        """Return a new report of the layout, with all its bits set to 0."""
+        return bytearray(self.length)
@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.report_queue.ReportQueue`
+====================================================
+"""
+
+from . import _ticks_add, _ticks_diff, _ticks_ms
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+
+class ReportQueue:  # pylint: disable=too-many-instance-attributes
+    """Queue the reports sent to a HID device in a fixed-size ring buffer, and send them
+    later, at most one per ``interval``, when `poll()` is called or from the `run()` task.
+
+    A ReportQueue implements ``send_report()``, ``usage_page`` and ``usage``, so it can be
+    given to `Keyboard`, `Mouse` or `ConsumerControl` instead of the device itself.
+    Their methods then return as soon as the report is copied into the queue.
+    No memory is allocated once the queue is created.
+
+    :param device: the device to send the reports to.
+    :param int report_length: length in bytes of the reports sent to this device.
+    :param int size: number of reports the queue can hold.
+    :param int policy: what to do with a new report when the queue is full:
+      `BLOCK`, `DROP_OLDEST` or `COALESCE`.
+    :param float interval: minimum time in seconds between reports sent to the device,
+      usually the host polling interval of the endpoint. It is counted in whole milliseconds.
+
+    Example::
+
+        import usb_hid
+        from adafruit_hid import find_device
+        from adafruit_hid.keyboard import Keyboard
+        from adafruit_hid.report_queue import ReportQueue
+
+        queue = ReportQueue(find_device(usb_hid.devices, usage_page=0x1, usage=0x06), 8)
+        kbd = Keyboard(queue)
+        kbd.send(Keycode.A)  # returns immediately
+        while True:
+            queue.poll()
+            # ... do other things
+    """
+
+    BLOCK = 0
+    """When the queue is full, send the oldest report right away, waiting for the device."""
+    DROP_OLDEST = 1
+    """When the queue is full, drop the oldest report to make room."""
+    COALESCE = 2
+    """When the queue is full, replace the newest queued report with the new one.
+    Intermediate states are lost, so only use it for devices such as gamepads,
+    where each report gives the complete state."""
+
+    def __init__(
+        self,
+        device: object,
+        report_length: int,
+        *,
+        size: int = 16,
+        policy: int = BLOCK,
+        interval: float = 0.001
+    ) -> None:
+        self._device = device
+        self.usage_page = device.usage_page
+        """The usage page of the device."""
+        self.usage = device.usage
+        """The usage of the device."""
+        self.in_report_lengths = (report_length,)
+        """The length of the reports sent, so that `Mouse` and the other HID objects
+        pick the report format of the device."""
+        self.policy = policy
+        """What to do with a new report when the queue is full."""
+        self.interval = interval
+        """Minimum time in seconds between reports sent to the device."""
+
+        self._report_length = report_length
+        self._size = size
+        buffer = memoryview(bytearray(size * report_length))
+        # Views onto each report slot in the ring buffer.
+        self._slots = tuple(
+            buffer[i * report_length : (i + 1) * report_length] for i in range(size)
+        )
+        # Slot of the oldest queued report, and number of queued reports.
+        self._head = 0
+        self._depth = 0
+        # Ticks at which poll() may send the next report.
+        self._next_send = _ticks_ms()
+
+        self.max_depth = 0
+        """Highest number of reports queued at once."""
+        self.dropped = 0
+        """Number of reports dropped by `DROP_OLDEST`."""
+        self.coalesced = 0
+        """Number of reports merged by `COALESCE`."""
+
+    @property
+    def depth(self) -> int:
+        """Number of reports currently queued."""
+        return self._depth
+
+    def send_report(self, report: bytes) -> None:
+        """Copy the report into the queue.
+
+        :param report: a report of ``report_length`` bytes.
+        :raises ValueError: if the report does not have the right length.
+        """
+        if len(report) != self._report_length:
+            raise ValueError("Report must be {} bytes".format(self._report_length))
+        if self._depth == self._size:
+            if self.policy == self.COALESCE:
+                self._slots[(self._head + self._depth - 1) % self._size][:] = report
+                self.coalesced += 1
+                return
+            if self.policy == self.DROP_OLDEST:
+                self._head = (self._head + 1) % self._size
+                self._depth -= 1
+                self.dropped += 1
+            else:
+                self._send_oldest()
+        self._slots[(self._head + self._depth) % self._size][:] = report
+        self._depth += 1
+        if self._depth > self.max_depth:
+            self.max_depth = self._depth
+
+    def get_last_received_report(self) -> Optional[bytes]:
+        """Return the last report received from the host by the device,
+        such as the keyboard LED status."""
+        return self._device.get_last_received_report()
+
+    def poll(self) -> int:
+        """Send the oldest queued report, if any, unless the previous one was sent
+        less than ``interval`` ago. Call this often, such as in the main loop.
+
+        :returns: the number of reports sent, 0 or 1.
+        """
+        if not self._depth:
+            return 0
+        now = _ticks_ms()
+        interval = round(self.interval * 1000)
+        # A deadline further than the interval is stale, the ticks having wrapped around.
+        if 0 < _ticks_diff(self._next_send, now) <= interval:
+            return 0
+        self._send_oldest()
+        self._next_send = _ticks_add(now, interval)
+        return 1
+
+    def flush(self) -> None:
+        """Send all the queued reports now, waiting for the device."""
+        while self._depth:
+            self._send_oldest()
+
+    async def run(self) -> None:
+        """Task sending the queued reports, at most one per ``interval``.
+        Requires the ``asyncio`` library.
+
+        Example::
+
+            asyncio.create_task(queue.run())
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        while True:
+            if self._depth:
+                self._send_oldest()
+            await asyncio.sleep(self.interval)
+
+    def _send_oldest(self) -> None:
+        """Send the oldest queued report to the device."""
+        self._device.send_report(self._slots[self._head])
+        self._head = (self._head + 1) % self._size
+        self._depth -= 1
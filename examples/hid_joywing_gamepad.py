@@ -9,6 +9,8 @@
 # in order to use this example.
 # See this Learn Guide for details:
 # https://learn.adafruit.com/customizing-usb-devices-in-circuitpython/hid-devices#custom-hid-devices-3096614-9
+# or enable adafruit_hid.gamepad.create_device(), which makes the same device:
+#     usb_hid.enable((usb_hid.Device.KEYBOARD, create_device()))
 
 import time
 
@@ -17,12 +19,8 @@ import busio
 from micropython import const
 from adafruit_seesaw.seesaw import Seesaw
 import usb_hid
-from hid_gamepad import Gamepad
-
-
-def range_map(value, in_min, in_max, out_min, out_max):
-    return (value - in_min) * (out_max - out_min) // (in_max - in_min) + out_min
-
+from adafruit_hid.axis_conditioner import AxisConditioner
+from adafruit_hid.gamepad import Gamepad
 
 BUTTON_RIGHT = const(6)
 BUTTON_DOWN = const(7)
@@ -43,22 +41,18 @@ ss = Seesaw(i2c)
 
 ss.pin_mode_bulk(button_mask, ss.INPUT_PULLUP)
 
-last_game_x = 0
-last_game_y = 0
+# Smooth the 10-bit readings of the joystick, ignore small moves around its center,
+# and only send a report when an axis moves by at least 2.
+conditioner = AxisConditioner(
+    2, in_max=1023, smoothing=2, deadzone=6, hysteresis=2, threshold=2
+)
+# The stick is at rest when the program starts: use its position as the center.
+conditioner.calibrate_center((ss.analog_read(2), ss.analog_read(3)))
 
-g = Gamepad(usb_hid.devices)
+g = Gamepad(usb_hid.devices, conditioner=conditioner)
 
 while True:
-    x = ss.analog_read(2)
-    y = ss.analog_read(3)
-
-    game_x = range_map(x, 0, 1023, -127, 127)
-    game_y = range_map(y, 0, 1023, -127, 127)
-    if last_game_x != game_x or last_game_y != game_y:
-        last_game_x = game_x
-        last_game_y = game_y
-        print(game_x, game_y)
-        g.move_joysticks(x=game_x, y=game_y)
+    g.update_axes((ss.analog_read(2), ss.analog_read(3)))
 
     buttons = (BUTTON_RIGHT, BUTTON_DOWN, BUTTON_LEFT, BUTTON_UP, BUTTON_SEL)
     button_state = [False] * len(buttons)
@@ -5,13 +5,15 @@
 # in order to use this example.
 # See this Learn Guide for details:
 # https://learn.adafruit.com/customizing-usb-devices-in-circuitpython/hid-devices#custom-hid-devices-3096614-9
+# or enable adafruit_hid.gamepad.create_device(), which makes the same device:
+#     usb_hid.enable((usb_hid.Device.KEYBOARD, create_device()))
 
 import board
 import digitalio
 import analogio
 import usb_hid
 
-from hid_gamepad import Gamepad
+from adafruit_hid.gamepad import Gamepad
 
 gp = Gamepad(usb_hid.devices)
 
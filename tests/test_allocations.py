@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Check that the allocation-free entry points allocate no memory once warmed up."""
+
+import tracemalloc
+
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.macro import Macro
+
+SHORTCUT = bytes((Keycode.CONTROL, Keycode.C))
+
+
+class StubDevice:
+    """Stand-in for a keyboard ``usb_hid.Device`` that ignores the reports."""
+
+    usage_page = 0x01
+    usage = 0x06
+
+    def send_report(self, report):
+        pass
+
+    @staticmethod
+    def get_last_received_report():
+        return None
+
+
+def allocated(func):
+    """Return the peak memory allocated by a call of ``func``, after a first call."""
+    func()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+@pytest.fixture(name="kbd")
+def fixture_kbd():
+    return Keyboard(StubDevice())
+
+
+@pytest.mark.parametrize(
+    "call",
+    (
+        lambda kbd: kbd.press_key(Keycode.A),
+        lambda kbd: kbd.release_key(Keycode.A),
+        lambda kbd: kbd.press_key(Keycode.SHIFT),
+        lambda kbd: kbd.release_key(Keycode.SHIFT),
+        lambda kbd: kbd.press_keys(SHORTCUT),
+        lambda kbd: kbd.release_keys(SHORTCUT),
+        lambda kbd: kbd.release_all(),
+    ),
+    ids=(
+        "press_key",
+        "release_key",
+        "press_key modifier",
+        "release_key modifier",
+        "press_keys",
+        "release_keys",
+        "release_all",
+    ),
+)
+def test_keyboard_allocates_nothing(kbd, call):
+    assert allocated(lambda: call(kbd)) == 0
+
+
+def test_deduplicated_release_all():
+    kbd = Keyboard(StubDevice(), deduplicate=True)
+    assert allocated(kbd.release_all) == 0
+
+
+def test_macro_run(kbd):
+    macro = Macro.compile("{CTRL+C}{PRESS SHIFT}{A}{B}{RELEASE}{CTRL+ALT+T}")
+    assert allocated(lambda: macro.run(keyboard=kbd)) == 0
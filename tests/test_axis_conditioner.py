@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.axis_conditioner import AxisConditioner
+
+
+def settle(conditioner, center, reading, updates=3000):
+    # Start from the center, as the first reading is taken as is, without smoothing.
+    conditioner.reset()
+    conditioner.update((center,))
+    for _ in range(updates):
+        conditioner.update((reading,))
+    return conditioner.values[0]
+
+
+@pytest.mark.parametrize("smoothing", range(9))
+def test_ends_are_reached(smoothing):
+    conditioner = AxisConditioner(1, smoothing=smoothing)
+    assert settle(conditioner, 32767, 65535) == 127
+    assert settle(conditioner, 32767, 0) == -127
+
+
+def test_ends_with_deadzone():
+    # The parameters of the Joy FeatherWing example.
+    conditioner = AxisConditioner(1, in_max=1023, deadzone=6, hysteresis=2, threshold=2)
+    assert settle(conditioner, 511, 1023) == 127
+    assert settle(conditioner, 511, 0) == -127
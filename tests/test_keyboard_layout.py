@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+
+TEXT = "The quick brown fox jumps over the lazy dog. THE QUICK BROWN FOX! 0123456789\n"
+MODES = (
+    KeyboardLayoutBase.TYPING_CLASSIC,
+    KeyboardLayoutBase.TYPING_FAST,
+    KeyboardLayoutBase.TYPING_ROLLOVER,
+    KeyboardLayoutBase.TYPING_ROLLOVER_STRICT,
+)
+
+
+class StubDevice:
+    usage_page = 0x01
+    usage = 0x06
+
+    def __init__(self):
+        self.reports = bytearray()
+
+    def send_report(self, report):
+        self.reports.extend(report)
+
+
+@pytest.fixture(name="device")
+def fixture_device():
+    return StubDevice()
+
+
+@pytest.fixture(name="layout")
+def fixture_layout(device):
+    KeyboardLayoutBase.report_cache.clear()
+    return KeyboardLayoutUS(Keyboard(device))
+
+
+def test_write_caches(layout, device):
+    layout.write("sudo systemctl restart x\n")
+    assert KeyboardLayoutBase.report_cache.size > 0
+    assert device.reports == layout.compile("sudo systemctl restart x\n")
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_write(layout, device, mode):
+    layout.typing_mode = mode
+    layout.write(TEXT)
+    assert device.reports == layout.compile(TEXT)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_long_write(layout, device, mode):
+    # Too long for the report cache: sent part by part, as compiled whole.
+    layout.typing_mode = mode
+    layout.write(TEXT * 20)
+    assert KeyboardLayoutBase.report_cache.size == 0
+    assert device.reports == layout.compile(TEXT * 20)
+
+
+def test_long_write_checks_first(layout, device):
+    with pytest.raises(ValueError):
+        layout.write(TEXT * 20 + "é")
+    assert not device.reports
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.macro import Macro
+
+
+@pytest.mark.parametrize(
+    "source",
+    (
+        "{}",
+        "{WAIT}",
+        "{WAIT 3 s}",
+        "{CC}",
+        "{MOUSE}",
+        "{MOUSE CLICK}",
+        "{MOUSE MOVE 100}",
+        "{MOUSE SCROLL}",
+        "{MOUSE JUMP 1}",
+        "{WAIT 300",
+    ),
+)
+def test_invalid_source(source):
+    with pytest.raises(ValueError):
+        Macro.compile(source)
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+from adafruit_hid import mouse as mouse_module
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.mouse_trajectory import Trajectory
+
+
+class StubDevice:
+    usage_page = 0x01
+    usage = 0x02
+    in_report_lengths = (4,)
+
+    def __init__(self):
+        self.reports = []
+
+    def send_report(self, report):
+        self.reports.append(bytes(report))
+
+
+def test_follow_paces_reports(monkeypatch):
+    clock = [0]
+    sleeps = []
+    monkeypatch.setattr(mouse_module, "_ticks_ms", lambda: clock[0])
+    monkeypatch.setattr(mouse_module.time, "sleep", sleeps.append)
+    device = StubDevice()
+    mouse = Mouse(device)
+    mouse.follow(Trajectory(array("b", (1, 0, 2, 0, 3, 0))), rate=100)
+    assert [report[1] for report in device.reports] == [1, 2, 3]
+    # No sleep after the last report.
+    assert sleeps == [0.01, 0.02]
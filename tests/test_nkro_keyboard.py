@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.nkro_keyboard import NKROKeyboard
+
+
+class StubDevice:
+    usage_page = 0x01
+    usage = 0x06
+
+    def __init__(self):
+        self.reports = []
+
+    def send_report(self, report):
+        self.reports.append(bytes(report))
+
+
+class SizedDevice(StubDevice):
+    """Like a CircuitPython ``usb_hid.Device``: rejects reports of another length,
+    without telling its report lengths."""
+
+    def __init__(self, length):
+        super().__init__()
+        self.length = length
+
+    def send_report(self, report):
+        if len(report) != self.length:
+            raise ValueError(
+                "Buffer incorrect size. Should be {} bytes.".format(self.length)
+            )
+        super().send_report(report)
+
+
+class DeclaredDevice(StubDevice):
+    """Like a Blinka device, telling its report lengths."""
+
+    def __init__(self, length):
+        super().__init__()
+        self.in_report_lengths = (length,)
+
+
+@pytest.mark.parametrize("keycode", (0x04, 0xDD, 0xDE, 0xDF))
+def test_press_and_release_key(keycode):
+    kbd = NKROKeyboard(StubDevice())
+    kbd.press_key(keycode)
+    assert kbd.report[1 + (keycode >> 3)] == 1 << (keycode & 7)
+    kbd.release_key(keycode)
+    assert not any(kbd.report)
+
+
+@pytest.mark.parametrize("keycode", (0x00, 0xE8, 0xFF, 0x100, -1))
+def test_invalid_keycode(keycode):
+    with pytest.raises(ValueError):
+        NKROKeyboard(StubDevice()).press_key(keycode)
+
+
+def test_boot_keyboard_rejects_0xde():
+    with pytest.raises(ValueError):
+        Keyboard(StubDevice()).press_key(0xDE)
+
+
+def test_skips_boot_keyboard_device():
+    boot, nkro = SizedDevice(8), SizedDevice(29)
+    kbd = NKROKeyboard((boot, nkro))
+    kbd.press_key(0x04)
+    assert not boot.reports
+    assert nkro.reports[-1][1] == 0x10
+
+
+def test_declared_report_lengths():
+    boot, nkro = DeclaredDevice(8), DeclaredDevice(29)
+    kbd = NKROKeyboard((boot, nkro))
+    kbd.press_key(0x04)
+    assert not boot.reports
+    assert len(nkro.reports) == 1
+
+
+def test_no_nkro_device():
+    with pytest.raises(ValueError):
+        NKROKeyboard((SizedDevice(8),))
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid import _ticks_diff, _TICKS_MAX
+from adafruit_hid import mouse as mouse_module
+from adafruit_hid import report_queue
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.report_queue import ReportQueue
+
+
+class StubDevice:
+    usage_page = 0x01
+    usage = 0x06
+
+    def __init__(self):
+        self.reports = []
+
+    def send_report(self, report):
+        self.reports.append(bytes(report))
+
+
+class SizedDevice(StubDevice):
+    """Like a CircuitPython usb_hid.Device: no in_report_lengths, but reports of
+    another length are rejected."""
+
+    usage = 0x02
+
+    def __init__(self, length):
+        super().__init__()
+        self.length = length
+
+    def send_report(self, report):
+        if len(report) != self.length:
+            raise ValueError("Buffer incorrect size. Should be {}".format(self.length))
+        super().send_report(report)
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    clock = [0]
+    monkeypatch.setattr(report_queue, "_ticks_ms", lambda: clock[0])
+    return clock
+
+
+def test_ticks_diff_wraps_around():
+    assert _ticks_diff(2, _TICKS_MAX) == 3
+    assert _ticks_diff(_TICKS_MAX, 2) == -3
+
+
+@pytest.mark.parametrize("start", (1000, _TICKS_MAX))
+def test_poll_paces_reports(clock, start):
+    clock[0] = start
+    device = StubDevice()
+    queue = ReportQueue(device, 1)
+    for i in range(3):
+        queue.send_report(bytes((i,)))
+    assert queue.poll() == 1
+    assert queue.poll() == 0
+    clock[0] = (clock[0] + 1) & _TICKS_MAX
+    assert queue.poll() == 1
+    assert queue.poll() == 0
+    clock[0] = (clock[0] + 1) & _TICKS_MAX
+    assert queue.poll() == 1
+    assert device.reports == [b"\x00", b"\x01", b"\x02"]
+
+
+def test_poll_after_long_idle(clock):
+    device = StubDevice()
+    queue = ReportQueue(device, 1)
+    queue.send_report(b"\x00")
+    queue.poll()
+    # Idle for longer than half the ticks period: the deadline looks far in the future.
+    clock[0] = 3 << 27
+    queue.send_report(b"\x01")
+    assert queue.poll() == 1
+
+
+def test_mouse_report_length():
+    device = StubDevice()
+    device.usage = 0x02
+    mouse = Mouse(ReportQueue(device, 7))
+    mouse.move(x=300)
+    assert len(mouse.report) == 7
+
+
+@pytest.mark.parametrize("length", [4, 7])
+def test_mouse_probes_length(monkeypatch, length):
+    monkeypatch.setattr(mouse_module, "Device", SizedDevice)
+    device = SizedDevice(length)
+    mouse = Mouse(device)
+    assert len(mouse.report) == length
+    mouse.move(x=100)
+    assert device.reports[-1][:2] == b"\x00\x64"
+    assert not any(any(report) for report in device.reports[:-1])
+
+
+def test_mouse_other_device_length():
+    device = SizedDevice(4)
+    mouse = Mouse(device)
+    assert len(mouse.report) == 4
+    assert not device.reports
@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark adafruit_hid on the host computer, without any HID hardware.
+
+Run it with CPython from the root of the repository, with Adafruit-Blinka installed
+(it provides the ``micropython`` and ``usb_hid`` modules)::
+
+    python tools/hid_benchmark.py -o results.json
+    python tools/hid_benchmark.py --compare results.json
+
+The devices are replaced by `RecordingDevice` objects, that count the reports sent to them.
+The results are written as JSON, so that they can be compared between releases.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, ".")
+
+# pylint: disable=wrong-import-position
+import adafruit_hid
+from adafruit_hid.axis_conditioner import AxisConditioner
+from adafruit_hid.consumer_control import ConsumerControl
+from adafruit_hid.consumer_control_code import ConsumerControlCode
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.gamepad import Gamepad
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.mouse import Mouse
+
+SAMPLE_TEXT = (
+    "The quick brown fox jumps over the lazy dog. THE QUICK BROWN FOX! 0123456789\n"
+)
+MOUSE_DISTANCES = (10, 127, 500, 1500, 5000)
+OPERATIONS = 10000
+# The joystick trace is sampled like the Joy FeatherWing example: 10-bit, every 10 ms.
+JOYSTICK_RATE = 100
+JOYSTICK_SECONDS = 20
+JOYSTICK_NOISE = 3
+SHORTCUT = bytes((Keycode.CONTROL, Keycode.C))
+
+
+class RecordingDevice:
+    """Stand-in for a ``usb_hid.Device``, counting the reports sent to it."""
+
+    def __init__(self, usage_page, usage):
+        self.usage_page = usage_page
+        self.usage = usage
+        self.reports = 0
+        self.report_bytes = 0
+
+    def send_report(self, report):
+        """Count the report."""
+        self.reports += 1
+        self.report_bytes += len(report)
+
+    @staticmethod
+    def get_last_received_report():
+        """No report is ever received from the host."""
+        return None
+
+    def reset(self):
+        """Reset the counters."""
+        self.reports = 0
+        self.report_bytes = 0
+
+
+def make_devices():
+    """Return recording keyboard, mouse and consumer control devices."""
+    return (
+        RecordingDevice(0x01, 0x06),
+        RecordingDevice(0x01, 0x02),
+        RecordingDevice(0x0C, 0x01),
+    )
+
+
+def measure_call(func, operations=OPERATIONS):
+    """Return the wall time for ``operations`` calls and the memory allocated per call."""
+    func()  # Warm up caches.
+    start = time.perf_counter()
+    for _ in range(operations):
+        func()
+    wall_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    func()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    for _ in range(100):
+        func()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_time_s": wall_time,
+        "operations": operations,
+        "peak_bytes_per_call": peak - before,
+        "retained_bytes_per_call": (after - before) / 101,
+    }
+
+
+class NullDevice(RecordingDevice):
+    """Stand-in for a ``usb_hid.Device`` that does not even count reports,
+    so that it does not allocate memory."""
+
+    def send_report(self, report):
+        """Ignore the report."""
+
+
+def check_allocations():
+    """Check that the steady-state Keyboard methods allocate no memory.
+
+    :returns: a dict of method name: bytes allocated by one call, all 0 if the check passes.
+    """
+    kbd = Keyboard(NullDevice(0x01, 0x06))
+    deduplicating_kbd = Keyboard(NullDevice(0x01, 0x06), deduplicate=True)
+    cases = {
+        "Keyboard.press_key": lambda: kbd.press_key(Keycode.A),
+        "Keyboard.release_key": lambda: kbd.release_key(Keycode.A),
+        "Keyboard.press_keys": lambda: kbd.press_keys(SHORTCUT),
+        "Keyboard.release_keys": lambda: kbd.release_keys(SHORTCUT),
+        "Keyboard.release_all, deduplicated": deduplicating_kbd.release_all,
+    }
+    results = {}
+    for name, func in cases.items():
+        func()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = peak - before
+    return results
+
+
+def method_cases(kbd, layout, mouse, consumer_control):
+    """Return the public methods to measure, as a dict of name: callable."""
+    compiled = layout.compile("Hello")
+    return {
+        "Keyboard.press": lambda: kbd.press(Keycode.A),
+        "Keyboard.release": lambda: kbd.release(Keycode.A),
+        "Keyboard.press_key": lambda: kbd.press_key(Keycode.A),
+        "Keyboard.release_key": lambda: kbd.release_key(Keycode.A),
+        "Keyboard.press_keys": lambda: kbd.press_keys(SHORTCUT),
+        "Keyboard.release_keys": lambda: kbd.release_keys(SHORTCUT),
+        "Keyboard.release_all": kbd.release_all,
+        "Keyboard.send": lambda: kbd.send(Keycode.SHIFT, Keycode.A),
+        "Keyboard.send_reports": lambda: kbd.send_reports(compiled),
+        "Keyboard.led_on": lambda: kbd.led_on(Keyboard.LED_CAPS_LOCK),
+        "KeyboardLayoutUS.write": lambda: layout.write("Hello"),
+        "KeyboardLayoutUS.compile": lambda: layout.compile("Hello"),
+        "KeyboardLayoutUS.keycodes": lambda: layout.keycodes("A"),
+        "Mouse.press": lambda: mouse.press(Mouse.LEFT_BUTTON),
+        "Mouse.release": lambda: mouse.release(Mouse.LEFT_BUTTON),
+        "Mouse.release_all": mouse.release_all,
+        "Mouse.click": lambda: mouse.click(Mouse.LEFT_BUTTON),
+        "Mouse.move": lambda: mouse.move(10, -10, 1),
+        "ConsumerControl.press": lambda: consumer_control.press(
+            ConsumerControlCode.MUTE
+        ),
+        "ConsumerControl.release": consumer_control.release,
+        "ConsumerControl.send": lambda: consumer_control.send(ConsumerControlCode.MUTE),
+    }
+
+
+def bench_typing(kbd_device, layout):
+    """Return the reports per character of KeyboardLayoutUS.write for each typing mode."""
+    results = {}
+    for name in (
+        "TYPING_CLASSIC",
+        "TYPING_FAST",
+        "TYPING_ROLLOVER",
+        "TYPING_ROLLOVER_STRICT",
+    ):
+        mode = getattr(layout, name, None)
+        if mode is None:
+            continue
+        layout.typing_mode = mode
+        layout.report_cache.clear()
+        kbd_device.reset()
+        start = time.process_time()
+        layout.write(SAMPLE_TEXT)
+        cpu_time = time.process_time() - start
+        results[name] = {
+            "characters": len(SAMPLE_TEXT),
+            "reports": kbd_device.reports,
+            "reports_per_character": kbd_device.reports / len(SAMPLE_TEXT),
+            "first_write_cpu_time_s": cpu_time,
+        }
+    layout.typing_mode = layout.TYPING_CLASSIC
+    return results
+
+
+def bench_mouse(mouse_device, mouse):
+    """Return the reports and CPU time of Mouse.move for each distance."""
+    results = {}
+    for distance in MOUSE_DISTANCES:
+        mouse_device.reset()
+        start = time.process_time()
+        for _ in range(100):
+            mouse.move(x=distance, y=-distance)
+        cpu_time = (time.process_time() - start) / 100
+        results[str(distance)] = {
+            "reports": mouse_device.reports // 100,
+            "cpu_time_s": cpu_time,
+        }
+    return results
+
+
+def joystick_trace(seed=1):
+    """Return a reproducible two-axis trace of noisy 10-bit joystick readings.
+
+    The stick rests, sweeps slowly, is held deflected, then flicks back and forth,
+    spending a quarter of the time in each phase. Gaussian ADC noise of
+    ``JOYSTICK_NOISE`` counts and an occasional spike are added to every reading.
+    """
+    rng = random.Random(seed)
+    samples = JOYSTICK_RATE * JOYSTICK_SECONDS
+    trace = []
+    for i in range(samples):
+        phase, position = divmod(4 * i, samples)
+        position /= samples
+        if phase == 0:
+            x, y = 0.0, 0.0
+        elif phase == 1:
+            x, y = math.sin(2 * math.pi * position), math.cos(2 * math.pi * position)
+            y -= 1
+        elif phase == 2:
+            x, y = 0.6, -0.3
+        else:
+            x, y = (1.0 if int(position * 8) % 2 else -1.0), 0.0
+        readings = []
+        for value in (x, y):
+            reading = 512 + value * 511 + rng.gauss(0, JOYSTICK_NOISE)
+            if rng.random() < 0.01:
+                reading += rng.choice((-1, 1)) * 20
+            readings.append(min(1023, max(0, round(reading))))
+        trace.append(tuple(readings))
+    return trace
+
+
+def bench_gamepad():
+    """Return the reports per second of a Gamepad following a noisy joystick trace,
+    without and with an AxisConditioner."""
+    trace = joystick_trace()
+    device = RecordingDevice(0x01, 0x05)
+    gamepad = Gamepad(device)
+
+    device.reset()
+    start = time.process_time()
+    for x, y in trace:
+        # What the Joy FeatherWing example did before AxisConditioner.
+        gamepad.move_joysticks(
+            x=(x * 254) // 1023 - 127,
+            y=(y * 254) // 1023 - 127,
+        )
+    raw = (device.reports, time.process_time() - start)
+
+    gamepad.conditioner = AxisConditioner(
+        2, in_max=1023, smoothing=2, deadzone=6, hysteresis=2, threshold=2
+    )
+    gamepad.reset_all()
+    device.reset()
+    start = time.process_time()
+    for readings in trace:
+        gamepad.update_axes(readings)
+    conditioned = (device.reports, time.process_time() - start)
+
+    return {
+        name: {
+            "reports": reports,
+            "reports_per_second": reports / JOYSTICK_SECONDS,
+            "cpu_time_per_sample_s": cpu_time / len(trace),
+        }
+        for name, (reports, cpu_time) in (("raw", raw), ("conditioned", conditioned))
+    }
+
+
+def run():
+    """Run all the benchmarks and return the results."""
+    kbd_device, mouse_device, cc_device = make_devices()
+    kbd = Keyboard(kbd_device)
+    layout = KeyboardLayoutUS(kbd)
+    mouse = Mouse(mouse_device)
+    consumer_control = ConsumerControl(cc_device)
+
+    return {
+        "version": adafruit_hid.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "typing": bench_typing(kbd_device, layout),
+        "mouse_move": bench_mouse(mouse_device, mouse),
+        "gamepad_axes": bench_gamepad(),
+        "methods": {
+            name: measure_call(func)
+            for name, func in method_cases(kbd, layout, mouse, consumer_control).items()
+        },
+        "allocations": check_allocations(),
+    }
+
+
+def compare(old, new):
+    """Print the change of wall time per method between two result sets."""
+    for name, result in new["methods"].items():
+        if name not in old["methods"]:
+            print("{:32s} new".format(name))
+            continue
+        ratio = result["wall_time_s"] / old["methods"][name]["wall_time_s"]
+        print("{:32s} {:+7.1%}".format(name, ratio - 1))
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="JSON file to write, default stdout")
+    parser.add_argument(
+        "--compare", help="JSON results of a previous run to compare with"
+    )
+    parser.add_argument(
+        "--check-allocations",
+        action="store_true",
+        help="only check that the steady-state methods allocate no memory",
+    )
+    args = parser.parse_args()
+
+    if args.check_allocations:
+        allocations = check_allocations()
+        for name, allocated in allocations.items():
+            print("{:32s} {} bytes".format(name, allocated))
+        sys.exit(1 if any(allocations.values()) else 0)
+
+    results = run()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+    elif not args.compare:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            compare(json.load(previous), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Measure the import time and memory of each adafruit_hid module.
+
+Run it with CPython from the root of the repository, with Adafruit-Blinka installed
+(it provides the ``micropython`` and ``usb_hid`` modules)::
+
+    python tools/import_benchmark.py -o imports.json
+    python tools/import_benchmark.py --compare imports.json
+
+Each module is imported in a fresh interpreter, so that the modules it imports are
+counted too, as they would be at boot. On a CircuitPython board, copy this file to
+the board and call ``measure_import()`` from the REPL, right after a reload, to get
+the same figures from ``gc.mem_alloc()`` and ``time.monotonic_ns()``.
+"""
+
+import gc
+import json
+import sys
+import time
+
+MODULES = (
+    "adafruit_hid",
+    "adafruit_hid.keycode",
+    "adafruit_hid.keyboard",
+    "adafruit_hid.nkro_keyboard",
+    "adafruit_hid.keyboard_layout_base",
+    "adafruit_hid.keyboard_layout_us",
+    "adafruit_hid.mouse",
+    "adafruit_hid.mouse_trajectory",
+    "adafruit_hid.absolute_mouse",
+    "adafruit_hid.consumer_control",
+    "adafruit_hid.consumer_control_code",
+    "adafruit_hid.gamepad",
+    "adafruit_hid.axis_conditioner",
+    "adafruit_hid.report_layout",
+    "adafruit_hid.report_queue",
+    "adafruit_hid.report_filter",
+    "adafruit_hid.lazy_device",
+    "adafruit_hid.code_names",
+    "adafruit_hid.macro",
+)
+# Modules built into CircuitPython, or provided by Blinka on the host, and typing,
+# which does not exist on CircuitPython and is only imported for the annotations.
+PRELOADED = ("micropython", "usb_hid", "supervisor", "typing")
+REPEATS = 5
+
+
+def _mem_alloc(tracemalloc):
+    """Return the memory currently allocated, from tracemalloc when it is given."""
+    if tracemalloc:
+        return tracemalloc.get_traced_memory()[0]
+    return gc.mem_alloc()  # pylint: disable=no-member
+
+
+def measure_import(name):
+    """Import a module and return the time it took and the memory it kept allocated.
+
+    Only the first import of a module is meaningful: call this in a fresh interpreter.
+    The `PRELOADED` modules are imported beforehand, so that they are not counted.
+    """
+    # pylint: disable=import-outside-toplevel
+    for preloaded in PRELOADED:
+        try:
+            __import__(preloaded)
+        except ImportError:
+            pass
+    tracemalloc = None
+    if not hasattr(gc, "mem_alloc"):  # CPython
+        import tracemalloc
+
+        tracemalloc.start()
+    gc.collect()
+    before = _mem_alloc(tracemalloc)
+    start = time.monotonic_ns()
+    __import__(name)
+    elapsed = time.monotonic_ns() - start
+    gc.collect()
+    allocated = _mem_alloc(tracemalloc) - before
+    if tracemalloc:
+        tracemalloc.stop()
+    return {"import_time_ms": elapsed / 1e6, "memory_bytes": allocated}
+
+
+def run():
+    """Measure every module in fresh interpreters, keeping the fastest of `REPEATS` runs."""
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    results = {}
+    for name in MODULES:
+        runs = []
+        for _ in range(REPEATS):
+            output = subprocess.run(
+                (
+                    sys.executable,
+                    "-c",
+                    "import sys, json; sys.path[:0] = ['tools', '.']; "
+                    "from import_benchmark import measure_import; "
+                    "print(json.dumps(measure_import({!r})))".format(name),
+                ),
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            runs.append(json.loads(output))
+        results[name] = {
+            "import_time_ms": min(result["import_time_ms"] for result in runs),
+            "memory_bytes": min(result["memory_bytes"] for result in runs),
+        }
+    return results
+
+
+def compare(old, new):
+    """Print the change of import time and memory per module between two result sets."""
+    for name, result in new.items():
+        if name not in old:
+            print("{:40s} new".format(name))
+            continue
+        print(
+            "{:40s} {:+7.1%} time {:+8d} bytes".format(
+                name,
+                result["import_time_ms"] / old[name]["import_time_ms"] - 1,
+                result["memory_bytes"] - old[name]["memory_bytes"],
+            )
+        )
+
+
+def main():
+    """Command line entry point."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-o", "--output", help="JSON file to write, default stdout")
+    parser.add_argument(
+        "--compare", help="JSON results of a previous run to compare with"
+    )
+    args = parser.parse_args()
+
+    results = run()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+    elif not args.compare:
+        for name, result in results.items():
+            print(
+                "{:40s} {:8.3f} ms {:8d} bytes".format(
+                    name, result["import_time_ms"], result["memory_bytes"]
+                )
+            )
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            compare(json.load(previous), results)
+
+
+if __name__ == "__main__":
+    main()
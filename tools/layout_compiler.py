@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compile a keyboard layout class into a packed ``KEYCODE_TABLE``.
+
+Run it with CPython on the host computer, from the root of the repository::
+
+    python tools/layout_compiler.py adafruit_hid.keyboard_layout_us.KeyboardLayoutUS \\
+        -o keyboard_layout_us_packed.py --report
+
+The generated module defines a layout class with only a ``KEYCODE_TABLE`` bytes table,
+that `KeyboardLayoutBase` searches directly, instead of the ``ASCII_TO_KEYCODE``,
+``HIGHER_ASCII``, ``NEED_ALTGR`` and ``COMBINED_KEYS`` tables. Once compiled to .mpy,
+the table stays in flash memory.
+"""
+
+import argparse
+import importlib
+import inspect
+import struct
+import sys
+import time
+
+sys.path.insert(0, ".")
+
+# pylint: disable=wrong-import-position,protected-access
+from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase
+
+TABLE_ALTGR = 0x01
+TABLE_DEAD = 0x02
+
+
+def load_layout(name):
+    """Return the layout class named ``module.Class``, or the only one in ``module``."""
+    try:
+        return getattr(
+            importlib.import_module(name.rpartition(".")[0]), name.rpartition(".")[2]
+        )
+    except (ImportError, AttributeError, ValueError):
+        pass
+    module = importlib.import_module(name)
+    classes = {
+        cls
+        for _, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, KeyboardLayoutBase)
+        and cls is not KeyboardLayoutBase
+        and cls.__module__ == module.__name__
+    }
+    if len(classes) != 1:
+        raise ValueError("Name the layout class to compile in {}".format(name))
+    return classes.pop()
+
+
+def compile_table(layout_class):
+    """Return the packed ``KEYCODE_TABLE`` bytes for the layout class."""
+    layout = layout_class(None)
+    index = layout._char_index()
+    codes = sorted(index)
+    if codes and codes[-1] > 0xFFFF:
+        raise ValueError("Characters above U+FFFF are not supported")
+    keycodes = bytearray()
+    flags = bytearray()
+    combinations = bytearray()
+    for char_val in codes:
+        if len(index[char_val]) == 2:
+            keycodes.append(len(combinations) // 2)
+            flags.append(TABLE_DEAD)
+            combinations.extend(struct.pack(">H", layout.COMBINED_KEYS[char_val]))
+            continue
+        keycode_tuple = index[char_val][0]
+        keycode = keycode_tuple[-1]
+        if layout.SHIFT_CODE in keycode_tuple[:-1]:
+            keycode |= layout.SHIFT_FLAG
+        keycodes.append(keycode)
+        flags.append(TABLE_ALTGR if layout.RIGHT_ALT_CODE in keycode_tuple[:-1] else 0)
+    if len(combinations) // 2 > 256:
+        raise ValueError("Too many dead-key combinations")
+    return (
+        struct.pack("<HH", len(codes), len(combinations) // 2)
+        + struct.pack("<{}H".format(len(codes)), *codes)
+        + bytes(keycodes)
+        + bytes(flags)
+        + bytes(combinations)
+    )
+
+
+def table_layout_class(layout_class, table):
+    """Return a layout class using only the packed table."""
+    return type(layout_class.__name__, (KeyboardLayoutBase,), {"KEYCODE_TABLE": table})
+
+
+def write_module(output, layout_class, table):
+    """Write a Python module defining the packed layout class."""
+    output.write('"""Packed keyboard layout generated by layout_compiler.py."""\n\n')
+    output.write(
+        "from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase\n\n\n"
+    )
+    output.write("class {}(KeyboardLayoutBase):\n".format(layout_class.__name__))
+    output.write('    """{} as a packed table."""\n\n'.format(layout_class.__name__))
+    output.write("    KEYCODE_TABLE = (\n")
+    for start in range(0, len(table), 16):
+        line = "".join("\\x{:02x}".format(byte) for byte in table[start : start + 16])
+        output.write('        b"{}"\n'.format(line))
+    output.write("    )\n")
+
+
+def _deep_size(obj):
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k) + _deep_size(v) for k, v in obj.items())
+    elif isinstance(obj, tuple):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+def _lookups_per_second(lookup, codes, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for char_val in codes:
+            lookup(char_val)
+    return repeat * len(codes) / (time.perf_counter() - start)
+
+
+def report(layout_class, table):
+    """Print the size and lookup speed of the dict tables compared to the packed table."""
+    layout = layout_class(None)
+    index = layout._char_index()
+    packed = table_layout_class(layout_class, table)(None)
+    codes = sorted(index)
+    for char_val in codes:
+        if packed._table_combinations(char_val) != index[char_val]:
+            raise AssertionError("Packed table differs for {!r}".format(chr(char_val)))
+    tables = (
+        _deep_size(layout.HIGHER_ASCII)
+        + _deep_size(layout.COMBINED_KEYS)
+        + sys.getsizeof(layout.ASCII_TO_KEYCODE)
+        + sys.getsizeof(layout.NEED_ALTGR)
+    )
+    print("Layout: {} ({} characters)".format(layout_class.__name__, len(codes)))
+    print("Dict tables (CPython size):  {:8d} bytes".format(tables))
+    print("Dict index (CPython size):   {:8d} bytes".format(_deep_size(index)))
+    print("Packed table:                {:8d} bytes".format(len(table)))
+    print(
+        "Dict index lookups/s:        {:8.0f}".format(
+            _lookups_per_second(index.get, codes)
+        )
+    )
+    print(
+        "Packed table lookups/s:      {:8.0f}".format(
+            _lookups_per_second(packed._table_combinations, codes)
+        )
+    )
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("layout", help="layout class, as module.ClassName")
+    parser.add_argument("-o", "--output", help="Python module to write, default stdout")
+    parser.add_argument(
+        "--report", action="store_true", help="compare size and lookup speed"
+    )
+    args = parser.parse_args()
+
+    layout_class = load_layout(args.layout)
+    table = compile_table(layout_class)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            write_module(output, layout_class, table)
+    elif not args.report:
+        write_module(sys.stdout, layout_class, table)
+    if args.report:
+        report(layout_class, table)
+
+
+if __name__ == "__main__":
+    main()